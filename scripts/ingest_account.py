@@ -194,13 +194,12 @@ class IdempotentIngestionManager:
         
         transcriber.output_dir = self.transcriptions_dir
         
-        for i, video in enumerate(new_videos, 1):
+        # Audio downloads run ahead in background threads while we transcribe
+        for i, (video, result) in enumerate(transcriber.process_videos(new_videos), 1):
             video_id = video.get('video_id')
             print(f"[{i}/{len(new_videos)}] Processing: {video.get('title', 'Unknown')[:60]}...")
             
             try:
-                result = transcriber.process_single_video(video)
-                
                 # Merge video metadata into result
                 result_with_metadata = {**result, **video}
                 
@@ -211,7 +210,7 @@ class IdempotentIngestionManager:
                 elif result.get('skipped'):
                     self.mark_video_processed(video_id, result_with_metadata, False)
                     newly_skipped += 1
-                    print(f"    ⏭️  Skipped (no speech)")
+                    print(f"    ⏭️  Skipped ({result.get('reason', 'no speech')})")
                 else:
                     self.mark_video_processed(video_id, result_with_metadata, False)
                     newly_failed += 1
@@ -227,6 +226,8 @@ class IdempotentIngestionManager:
                 print(f"    ❌ Error: {e}")
                 self._save_index()
         
+        transcriber.close()
+        
         # Update final stats
         self.index["stats"]["last_ingestion_date"] = datetime.now().isoformat()
         self.index["stats"]["total_skipped"] = \
@@ -352,7 +353,7 @@ Features:
                 
             except ImportError:
                 print(f"⚠️  Topic extraction requires additional libraries")
-                print(f"   Install with: pip install keybert sentence-transformers scikit-learn nltk")
+                print(f"   Install with: pip install sentence-transformers scikit-learn nltk")
             except Exception as e:
                 print(f"⚠️  Topic extraction failed: {e}")
                 if args.verbose:
@@ -0,0 +1,92 @@
+"""
+Tests for batched transcription in tiktok_transcriber
+"""
+
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+
+import tiktok_transcriber
+from tiktok_transcriber import SAMPLE_RATE, TikTokTranscriber
+
+
+def _fake_speech_timestamps(audio, vad_options=None):
+    """Treat every non-zero sample as speech"""
+    voiced = np.flatnonzero(audio)
+    if not len(voiced):
+        return []
+    return [{"start": int(voiced[0]), "end": int(voiced[-1]) + 1}]
+
+
+class _FakeBatchedModel:
+    """Emit one segment per clip, labelled with the marker value of its audio"""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, vad_filter=True, clip_timestamps=None, **kwargs):
+        self.calls.append({"vad_filter": vad_filter, "clip_timestamps": clip_timestamps})
+        segments = [
+            SimpleNamespace(
+                start=round(clip["start"] / SAMPLE_RATE, 3),
+                text=f" video {int(audio[clip['start']])} ",
+            )
+            for clip in clip_timestamps
+        ]
+        return iter(segments), None
+
+
+def _make_transcriber():
+    transcriber = TikTokTranscriber.__new__(TikTokTranscriber)
+    transcriber.logger = logging.getLogger("test_tiktok_transcriber")
+    transcriber.batched_model = _FakeBatchedModel()
+    transcriber._finalize_transcription = lambda video, text: {"video_id": video["video_id"], "text": text}
+    return transcriber
+
+
+class TestTranscribeConcatenated:
+    """Each video in a concatenated batch keeps only its own text"""
+
+    def test_two_short_clips_are_split_per_video(self, monkeypatch):
+        monkeypatch.setattr(tiktok_transcriber, "get_speech_timestamps", _fake_speech_timestamps)
+        transcriber = _make_transcriber()
+        batch = [
+            ({"video_id": "a"}, np.full(3 * SAMPLE_RATE, 1, dtype=np.float32)),
+            ({"video_id": "b"}, np.full(2 * SAMPLE_RATE, 2, dtype=np.float32)),
+        ]
+
+        results = dict(
+            (video["video_id"], result)
+            for video, result in transcriber._transcribe_concatenated(batch)
+        )
+
+        assert results["a"]["text"] == "video 1"
+        assert results["b"]["text"] == "video 2"
+
+    def test_clips_stay_within_video_boundaries(self, monkeypatch):
+        monkeypatch.setattr(tiktok_transcriber, "get_speech_timestamps", _fake_speech_timestamps)
+        transcriber = _make_transcriber()
+        batch = [
+            ({"video_id": "a"}, np.full(3 * SAMPLE_RATE, 1, dtype=np.float32)),
+            ({"video_id": "b"}, np.full(2 * SAMPLE_RATE, 2, dtype=np.float32)),
+        ]
+
+        list(transcriber._transcribe_concatenated(batch))
+
+        call, = transcriber.batched_model.calls
+        assert call["vad_filter"] is False
+        assert call["clip_timestamps"] == [
+            {"start": 0, "end": 3 * SAMPLE_RATE},
+            {"start": 4 * SAMPLE_RATE, "end": 6 * SAMPLE_RATE},
+        ]
+
+    def test_silent_batch_skips_whisper(self, monkeypatch):
+        monkeypatch.setattr(tiktok_transcriber, "get_speech_timestamps", _fake_speech_timestamps)
+        transcriber = _make_transcriber()
+        batch = [({"video_id": "a"}, np.zeros(SAMPLE_RATE, dtype=np.float32))]
+
+        results = list(transcriber._transcribe_concatenated(batch))
+
+        assert transcriber.batched_model.calls == []
+        assert results == [({"video_id": "a"}, {"video_id": "a", "text": None})]
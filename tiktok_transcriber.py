@@ -6,47 +6,116 @@ Multi-account support with authentication and retry logic
 """
 
 import os
+import io
 import sys
+import atexit
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import tempfile
 import subprocess
 import time
+import random
+import queue
+import bisect
+import multiprocessing
+import itertools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Tuple, Union
 from datetime import datetime
 from dotenv import load_dotenv
+import numpy as np
 import yt_dlp
-from faster_whisper import WhisperModel
-import pandas as pd
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+from faster_whisper.audio import decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Load environment variables
 load_dotenv()
 
+# Loaded Whisper models keyed by (model_size, device, compute_type), shared by
+# every TikTokTranscriber in the process so weights are only read once
+_MODEL_CACHE: Dict[tuple, WhisperModel] = {}
+
+# Whisper's expected input sample rate
+SAMPLE_RATE = 16000
+
+# Silence handling inside Whisper calls: windows the VAD marks as silent are
+# skipped by the decoder instead of being transcribed
+VAD_PARAMETERS = dict(min_silence_duration_ms=500, speech_pad_ms=200)
+
+# Videos shorter than this (seconds) are skipped before download; the upper
+# bound comes from MAX_DURATION (default 600)
+MIN_DURATION = 2.0
+
+# yt-dlp error substrings (lowercased) that retrying will not fix
+NON_RETRYABLE_ERRORS = ("http error 404", "private", "not found", "does not exist")
+
+# Process-wide queued logging set up by TikTokTranscriber.setup_logging()
+_LOG_LISTENER: Optional[QueueListener] = None
+_LOG_QUEUE_HANDLER: Optional[QueueHandler] = None
+
+
+def _log_directly_in_child():
+    """Forked workers have no listener thread, so write records straight to the handlers"""
+    if _LOG_LISTENER is not None:
+        root = logging.getLogger()
+        root.removeHandler(_LOG_QUEUE_HANDLER)
+        for handler in _LOG_LISTENER.handlers:
+            root.addHandler(handler)
+
+
+os.register_at_fork(after_in_child=_log_directly_in_child)
+
 class TikTokTranscriber:
     """Real TikTok transcription pipeline using yt-dlp and faster-whisper"""
     
     def __init__(self, 
                  output_dir: str = "accounts",
-                 temp_dir: str = "/tmp/tiktok_transcriber",
+                 temp_dir: Optional[str] = None,
                  model_size: str = "small",
                  max_videos: Optional[int] = None,
                  cookies_file: Optional[str] = None,
-                 min_speech_threshold: int = 50):
+                 min_speech_threshold: int = 50,
+                 compute_type: Optional[str] = None,
+                 batch_audio_seconds: Optional[int] = None,
+                 write_txt: bool = True,
+                 force: bool = False,
+                 cpu_threads: Optional[int] = None):
         """
         Initialize TikTok transcriber
         
         Args:
             output_dir: Base directory to save transcriptions (accounts/<username>/transcriptions)
-            temp_dir: Temporary directory for audio files
+            temp_dir: Temporary directory for audio files (None = TEMP_DIR env var, else
+                /dev/shm/tiktok_transcriber when RAM-backed space allows, else /tmp/tiktok_transcriber)
             model_size: Whisper model size ('tiny', 'small', 'medium', 'large')
             max_videos: Maximum videos to process (None = use env var or default 10)
             cookies_file: Path to cookies.txt for authenticated scraping (optional)
             min_speech_threshold: Minimum characters to consider video has speech (default 50)
+            compute_type: CTranslate2 compute type (None = use env var or 'int8')
+            batch_audio_seconds: Seconds of audio from several videos to transcribe per
+                Whisper call (None = use env var; 0 = one call per video)
+            write_txt: Write one <video_id>_transcript.txt per video (default). When False,
+                transcriptions are appended to <username>_transcripts.jsonl instead
+            force: Re-transcribe videos that already have a transcript
+            cpu_threads: CTranslate2 threads for Whisper (None = WHISPER_THREADS env var,
+                else all cores)
         """
         self.base_output_dir = Path(output_dir)
-        self.temp_dir = Path(temp_dir)
+        self.temp_dir = Path(temp_dir or os.getenv('TEMP_DIR') or self._default_temp_dir())
         self.model_size = model_size or os.getenv('WHISPER_MODEL_SIZE', 'small')
+        self.compute_type = compute_type or os.getenv('WHISPER_COMPUTE', 'int8')
+        self.cpu_threads = cpu_threads or int(os.getenv('WHISPER_THREADS', os.cpu_count() or 4))
         
         # Get max_videos from parameter, env var, or default
         if max_videos is not None:
@@ -56,6 +125,15 @@ class TikTokTranscriber:
         
         self.cookies_file = cookies_file
         self.min_speech_threshold = min_speech_threshold
+        self.write_txt = write_txt
+        self.force = force
+        self._seen: Dict[str, Dict[str, Any]] = {}
+        self._transcript_jsonl: Optional[io.TextIOWrapper] = None
+        
+        if batch_audio_seconds is not None:
+            self.batch_audio_seconds = batch_audio_seconds
+        else:
+            self.batch_audio_seconds = int(os.getenv('WHISPER_BATCH_AUDIO_SECONDS', '0'))
         
         # Create directories
         self.base_output_dir.mkdir(exist_ok=True)
@@ -63,11 +141,27 @@ class TikTokTranscriber:
         
         # Setup logging
         self.setup_logging()
+        self.logger.info(f"Temp directory: {self.temp_dir}")
+        
+        # yt-dlp options are built once (including the cookies file check);
+        # call sites layer their overrides on top
+        self._base_opts = self._build_ydl_opts()
+        self._audio_opts = self._audio_ydl_opts()
         
         # Initialize Whisper model
         self.whisper_model = None
+        self.batched_model = None
         self.setup_whisper()
         
+        # yt-dlp handles are reused across videos and retries, one per thread
+        # since YoutubeDL is not thread-safe; the download pool is kept alive
+        # so those per-thread handles survive between accounts
+        self._ydl_local = threading.local()
+        self._ydl_handles: List[yt_dlp.YoutubeDL] = []
+        self._ydl_lock = threading.Lock()
+        self._download_pool: Optional[ThreadPoolExecutor] = None
+        self._download_pool_finalizer: Optional[weakref.finalize] = None
+        
         # Processing stats
         self.stats = {
             'total_videos': 0,
@@ -78,27 +172,61 @@ class TikTokTranscriber:
             'processing_time': 0.0
         }
     
+    @staticmethod
+    def _default_temp_dir() -> str:
+        """Prefer tmpfs (/dev/shm) for temp audio so it never touches disk, if it has room"""
+        try:
+            shm = os.statvfs('/dev/shm')
+            if shm.f_bavail * shm.f_bsize > 2 * 1024**3 and os.access('/dev/shm', os.W_OK):
+                return '/dev/shm/tiktok_transcriber'
+        except OSError:
+            pass
+        return '/tmp/tiktok_transcriber'
+    
     def setup_logging(self):
-        """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('tiktok_transcriber.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        """
+        Setup logging configuration
+        
+        Records are queued and written to the log file and stdout by a
+        QueueListener thread, so logging never blocks on file I/O in the
+        download/transcription paths. The listener is shared process-wide.
+        """
+        global _LOG_LISTENER, _LOG_QUEUE_HANDLER
+        if _LOG_LISTENER is None:
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handlers = [logging.FileHandler('tiktok_transcriber.log'), logging.StreamHandler(sys.stdout)]
+            for handler in handlers:
+                handler.setFormatter(formatter)
+            
+            log_queue = queue.Queue(-1)
+            _LOG_QUEUE_HANDLER = QueueHandler(log_queue)
+            _LOG_QUEUE_HANDLER.setFormatter(logging.Formatter('%(message)s'))
+            _LOG_LISTENER = QueueListener(log_queue, *handlers)
+            _LOG_LISTENER.start()
+            atexit.register(_LOG_LISTENER.stop)
+            
+            logging.basicConfig(level=logging.INFO, handlers=[_LOG_QUEUE_HANDLER])
         self.logger = logging.getLogger(__name__)
     
     def setup_whisper(self):
         """Initialize faster-whisper model"""
         try:
-            self.logger.info(f"Loading Whisper model: {self.model_size}")
-            self.whisper_model = WhisperModel(
-                self.model_size,
-                device="cpu",
-                compute_type="int8"
-            )
+            key = (self.model_size, "cpu", self.compute_type, self.cpu_threads)
+            self.whisper_model = _MODEL_CACHE.get(key)
+            if self.whisper_model is None:
+                self.logger.info(f"Loading Whisper model: {self.model_size} ({self.compute_type})")
+                # Saturate the allotted cores so the int8 GEMM kernels are not thread-starved
+                self.whisper_model = _MODEL_CACHE.setdefault(key, WhisperModel(
+                    self.model_size,
+                    device="cpu",
+                    compute_type=self.compute_type,
+                    cpu_threads=self.cpu_threads,
+                    num_workers=int(os.getenv('WHISPER_WORKERS', '2'))
+                ))
+            else:
+                self.logger.info(f"Reusing loaded Whisper model: {self.model_size}")
+            # Batched pipeline runs VAD-segmented chunks through the model together
+            self.batched_model = BatchedInferencePipeline(model=self.whisper_model)
             self.logger.info("Whisper model loaded successfully")
         except Exception as e:
             self.logger.error(f"Failed to load Whisper model: {e}")
@@ -148,19 +276,33 @@ class TikTokTranscriber:
             
             self.logger.info(f"Found {len(videos)} videos, processing up to {self.max_videos}")
             
-            # Process each video
+            # Videos transcribed by a previous run are reused, not downloaded again
+            self._load_previous_results(username)
+            videos_to_process = videos[:self.max_videos]
+            cached_videos, new_videos = [], []
+            for video in videos_to_process:
+                (cached_videos if self._already_done(video.get('video_id')) else new_videos).append(video)
+            if cached_videos:
+                self.logger.info(f"Reusing {len(cached_videos)} already-transcribed videos (use --force to redo)")
+            
+            # Process each video (audio is downloaded ahead in background threads)
             processed_videos = []
-            for i, video in enumerate(videos[:self.max_videos], 1):
-                self.logger.info(f"Processing video {i}/{min(len(videos), self.max_videos)}: {video.get('title', 'Unknown')}")
+            fresh_results = self.process_videos(new_videos)
+            video_results = itertools.chain(
+                ((video, self._cached_result(video)) for video in cached_videos),
+                fresh_results
+            )
+            
+            for i, (video, result) in enumerate(video_results, 1):
+                self.logger.info(f"Processed video {i}/{len(videos_to_process)}: {video.get('title', 'Unknown')}")
                 
                 try:
-                    result = self.process_single_video(video)
                     if result.get('success'):
                         processed_videos.append(result)
                         self.stats['processed_videos'] += 1
                     elif result.get('skipped'):
                         self.stats['skipped_videos'] += 1
-                        self.logger.info(f"Skipped video (no speech detected): {video.get('video_id')}")
+                        self.logger.info(f"Skipped video ({result.get('reason')}): {video.get('video_id')}")
                     else:
                         self.stats['failed_videos'] += 1
                         self.logger.error(f"Failed to process video: {result.get('error')}")
@@ -181,6 +323,7 @@ class TikTokTranscriber:
                 "timestamp": datetime.now().isoformat()
             }
             
+            self._close_transcript_jsonl()
             self.save_results(username, results)
             
             self.logger.info(f"\n{'='*60}")
@@ -212,82 +355,141 @@ class TikTokTranscriber:
         account_url = f"https://www.tiktok.com/@{username}"
         
         # Build yt-dlp options
-        ydl_opts = self._build_ydl_opts(extract_flat=False)
-        ydl_opts['playlist_items'] = f"1:{self.max_videos}"
+        ydl_opts = {**self._base_opts, 'playlist_items': f"1:{self.max_videos}"}
         
         for attempt in range(max_retries):
             try:
                 self.logger.info(f"Fetching videos for @{username} (attempt {attempt + 1}/{max_retries})")
                 
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(account_url, download=False)
-                    
-                    if not info:
-                        self.logger.warning(f"No info returned for @{username}")
-                        if attempt < max_retries - 1:
-                            time.sleep(2 ** attempt)  # Exponential backoff
-                            continue
-                        return []
-                    
-                    # Handle both single video and playlist responses
-                    entries = []
-                    if 'entries' in info:
-                        entries = [e for e in info['entries'] if e is not None]
-                    elif info.get('id'):
-                        # Single video response
-                        entries = [info]
-                    
-                    if not entries:
-                        self.logger.warning(f"No video entries found for @{username}")
-                        if attempt < max_retries - 1:
-                            time.sleep(2 ** attempt)
-                            continue
-                        return []
-                    
-                    # Parse video data
-                    videos = []
-                    for entry in entries[:self.max_videos]:
-                        try:
-                            video_data = {
-                                'video_id': entry.get('id'),
-                                'title': entry.get('title', ''),
-                                'description': entry.get('description', ''),
-                                'upload_date': entry.get('upload_date', ''),
-                                'duration': entry.get('duration', 0),
-                                'view_count': entry.get('view_count', 0),
-                                'like_count': entry.get('like_count', 0),
-                                'comment_count': entry.get('comment_count', 0),
-                                'url': entry.get('webpage_url', '') or entry.get('url', ''),
-                                'thumbnail': entry.get('thumbnail', ''),
-                            }
-                            
-                            if video_data['video_id']:
-                                videos.append(video_data)
-                                self.logger.debug(f"Found video: {video_data.get('title', 'Unknown')}")
-                        except Exception as e:
-                            self.logger.warning(f"Failed to parse video entry: {e}")
-                            continue
-                    
-                    if videos:
-                        self.logger.info(f"Successfully found {len(videos)} videos for @{username}")
-                        return videos
-                    else:
-                        self.logger.warning(f"No valid videos parsed for @{username}")
-                        if attempt < max_retries - 1:
-                            time.sleep(2 ** attempt)
-                            continue
-                            
+                ydl = self._get_ydl(ydl_opts)
+                info = ydl.extract_info(account_url, download=False)
+                
+                if not info:
+                    self.logger.warning(f"No info returned for @{username}")
+                    if attempt < max_retries - 1:
+                        time.sleep(self._backoff_delay(attempt))  # Exponential backoff
+                        continue
+                    return []
+                
+                # Handle both single video and playlist responses
+                entries = []
+                if 'entries' in info:
+                    entries = [e for e in info['entries'] if e is not None]
+                elif info.get('id'):
+                    # Single video response
+                    entries = [info]
+                
+                if not entries:
+                    self.logger.warning(f"No video entries found for @{username}")
+                    if attempt < max_retries - 1:
+                        time.sleep(self._backoff_delay(attempt))
+                        continue
+                    return []
+                
+                # Parse video data
+                videos = []
+                for entry in entries[:self.max_videos]:
+                    try:
+                        video_data = {
+                            'video_id': entry.get('id'),
+                            'title': entry.get('title', ''),
+                            'description': entry.get('description', ''),
+                            'upload_date': entry.get('upload_date', ''),
+                            'duration': entry.get('duration', 0),
+                            'view_count': entry.get('view_count', 0),
+                            'like_count': entry.get('like_count', 0),
+                            'comment_count': entry.get('comment_count', 0),
+                            'url': entry.get('webpage_url', '') or entry.get('url', ''),
+                            'thumbnail': entry.get('thumbnail', ''),
+                        }
+                        
+                        if video_data['video_id']:
+                            videos.append(video_data)
+                            self.logger.debug(f"Found video: {video_data.get('title', 'Unknown')}")
+                    except Exception as e:
+                        self.logger.warning(f"Failed to parse video entry: {e}")
+                        continue
+                
+                if videos:
+                    self.logger.info(f"Successfully found {len(videos)} videos for @{username}")
+                    return videos
+                else:
+                    self.logger.warning(f"No valid videos parsed for @{username}")
+                    if attempt < max_retries - 1:
+                        time.sleep(self._backoff_delay(attempt))
+                        continue
+                        
             except Exception as e:
                 self.logger.error(f"Attempt {attempt + 1} failed for @{username}: {e}")
+                # Missing or private accounts fail the same way on every attempt
+                message = str(e).lower()
+                if any(marker in message for marker in NON_RETRYABLE_ERRORS):
+                    self.logger.error(f"Not retrying @{username}: account is missing or private")
+                    return []
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    self.logger.info(f"Retrying in {wait_time}s...")
+                    wait_time = self._backoff_delay(attempt)
+                    self.logger.info(f"Retrying in {wait_time:.1f}s...")
                     time.sleep(wait_time)
                 else:
                     self.logger.error(f"All {max_retries} attempts failed for @{username}")
                     
         return []
     
+    def _get_ydl(self, opts: Dict[str, Any]) -> yt_dlp.YoutubeDL:
+        """
+        Return a cached YoutubeDL for these options on the calling thread
+        
+        Reusing the handle avoids re-reading cookies and re-initializing
+        extractors per call, and keeps HTTPS connections to TikTok alive.
+        
+        Args:
+            opts: yt-dlp options dictionary
+            
+        Returns:
+            YoutubeDL instance
+        """
+        cache = getattr(self._ydl_local, 'cache', None)
+        if cache is None:
+            cache = self._ydl_local.cache = {}
+        
+        key = json.dumps(opts, sort_keys=True, default=str)
+        ydl = cache.get(key)
+        if ydl is None:
+            ydl = cache[key] = yt_dlp.YoutubeDL(opts)
+            with self._ydl_lock:
+                self._ydl_handles.append(ydl)
+        return ydl
+    
+    def close(self):
+        """Shut down the download pool, close cached yt-dlp handles and the JSONL transcript file"""
+        self._close_transcript_jsonl()
+        
+        if self._download_pool is not None:
+            self._download_pool_finalizer()
+            self._download_pool = None
+            self._download_pool_finalizer = None
+        
+        with self._ydl_lock:
+            handles, self._ydl_handles = self._ydl_handles, []
+        for ydl in handles:
+            try:
+                ydl.close()
+            except Exception as e:
+                self.logger.debug(f"Failed to close yt-dlp handle: {e}")
+    
+    def __enter__(self) -> "TikTokTranscriber":
+        """Use the transcriber as a context manager that calls close() on exit"""
+        return self
+    
+    def __exit__(self, *exc_info):
+        """Release the download pool and open handles"""
+        self.close()
+    
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with +/-25% jitter so parallel account runs don't retry in lockstep"""
+        return (2 ** attempt) * random.uniform(0.75, 1.25)
+    
     def _build_ydl_opts(self, extract_flat: bool = False) -> Dict[str, Any]:
         """
         Build yt-dlp options with headers, cookies, and fallback formats
@@ -323,67 +525,454 @@ class TikTokTranscriber:
         
         return opts
     
-    def process_single_video(self, video: Dict[str, Any]) -> Dict[str, Any]:
+    def _prefetch_audio(self, videos: List[Dict[str, Any]], stop: threading.Event,
+                        max_workers: int = 4) -> "queue.Queue":
+        """
+        Fetch and decode audio for videos in background threads
+        
+        Fetching is network-bound, so it runs while the caller transcribes
+        (compute-bound) on the main thread. The queue is bounded to keep at
+        most a few decoded clips waiting in memory.
+        
+        Args:
+            videos: Video metadata dictionaries to fetch
+            stop: Set by the consumer when it stops reading; pending fetches are
+                dropped so no download thread blocks on the full queue
+            max_workers: Concurrent fetches (also the queue size)
+            
+        Returns:
+            Queue of (video, audio) tuples, terminated by None. audio is a
+            16 kHz float32 array, or None when fetching failed.
+        """
+        audio_queue = queue.Queue(maxsize=max_workers)
+        if self._download_pool is None:
+            self._download_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="audio-download")
+            # Shuts the pool down once the transcriber is collected (or at
+            # exit) without keeping the transcriber itself alive
+            self._download_pool_finalizer = weakref.finalize(
+                self, self._download_pool.shutdown, wait=False
+            )
+        
+        def put(item):
+            while not stop.is_set():
+                try:
+                    audio_queue.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+        
+        def fetch(video):
+            if stop.is_set():
+                return
+            try:
+                audio = self.fetch_audio(video)
+            except Exception as e:
+                self.logger.error(f"Failed to fetch audio for {video.get('video_id')}: {e}")
+                audio = None
+            put((video, audio))
+        
+        def produce():
+            try:
+                list(self._download_pool.map(fetch, videos))
+            finally:
+                put(None)
+        
+        threading.Thread(target=produce, name="audio-prefetch", daemon=True).start()
+        return audio_queue
+    
+    def _load_previous_results(self, username: str):
+        """Index the processed videos recorded in a previous run's <username>_results.json"""
+        self._seen = {}
+        results_file = self.output_dir / f"{username}_results.json"
+        if self.force or not results_file.exists():
+            return
+        
+        try:
+            with open(results_file, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            for item in previous.get('processed_videos', []):
+                if item.get('video_id'):
+                    self._seen[item['video_id']] = item
+        except Exception as e:
+            self.logger.warning(f"Failed to load previous results {results_file}: {e}")
+    
+    def _already_done(self, video_id: Optional[str]) -> bool:
+        """Check whether a video was transcribed by a previous run (always False with force)"""
+        if self.force or not video_id:
+            return False
+        if video_id in self._seen:
+            return True
+        
+        try:
+            existing = self.output_dir / f"{video_id}_transcript.txt"
+            return existing.stat().st_size > self.min_speech_threshold
+        except OSError:
+            return False
+    
+    def _cached_result(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the processing result for an already-transcribed video without re-running it"""
+        video_id = video.get('video_id')
+        result = self._seen.get(video_id)
+        if result is None:
+            content = (self.output_dir / f"{video_id}_transcript.txt").read_text(encoding='utf-8')
+            transcription = content.partition("=" * 50 + "\n\n")[2]
+            result = {
+                "success": True,
+                "video_id": video_id,
+                "title": video.get('title', ''),
+                "transcription": transcription,
+                "transcription_length": len(transcription),
+                "video_metadata": video,
+                "timestamp": datetime.now().isoformat()
+            }
+        return {**result, "cached": True}
+    
+    def _duration_skip(self, video: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Check a video's metadata duration against MIN_DURATION..MAX_DURATION
+        
+        Args:
+            video: Video metadata dictionary
+            
+        Returns:
+            Skipped result if the duration is out of range, else None
+            (also None when the duration is unknown)
+        """
+        duration = float(video.get('duration') or 0)
+        if duration and (duration < MIN_DURATION or duration > float(os.getenv('MAX_DURATION', '600'))):
+            return {
+                "success": False,
+                "skipped": True,
+                "reason": f"duration {duration:g}s out of range"
+            }
+        return None
+    
+    def _split_by_duration(self, videos: List[Dict[str, Any]]) -> Tuple[List[Tuple[Dict[str, Any], Dict[str, Any]]], List[Dict[str, Any]]]:
+        """Split videos into (video, skipped result) pairs for out-of-range durations and the rest"""
+        skipped, in_range = [], []
+        for video in videos:
+            skip = self._duration_skip(video)
+            if skip:
+                skipped.append((video, skip))
+            else:
+                in_range.append(video)
+        return skipped, in_range
+    
+    def process_videos(self, videos: List[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Transcribe videos with audio downloaded ahead in background threads
+        
+        Uses process_videos_batched when batch_audio_seconds is set, else one
+        Whisper call per video. Closing the iterator early stops the downloads.
+        
+        Args:
+            videos: Video metadata dictionaries
+            
+        Yields:
+            (video, result) tuples, result shaped like process_single_video()
+        """
+        if self.batch_audio_seconds > 0:
+            return self.process_videos_batched(videos, self.batch_audio_seconds)
+        return self._process_prefetched(videos)
+    
+    def _process_prefetched(self, videos: List[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Process videos one at a time as their prefetched audio arrives, yielding (video, result)"""
+        skipped, videos = self._split_by_duration(videos)
+        yield from skipped
+        
+        stop = threading.Event()
+        audio_queue = self._prefetch_audio(videos, stop)
+        try:
+            while (item := audio_queue.get()) is not None:
+                video, audio = item
+                if audio is not None:
+                    yield video, self.process_single_video(video, audio=audio)
+                else:
+                    yield video, {"success": False, "error": "Failed to download audio"}
+        finally:
+            # Also runs when the caller abandons the iterator or raises
+            stop.set()
+    
+    def process_single_video(self, video: Dict[str, Any], audio: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Process a single video: download audio and transcribe
         Auto-skip videos with minimal/no speech
         
         Args:
             video: Video metadata dictionary
+            audio: Already-fetched 16 kHz audio samples (fetched here if None)
             
         Returns:
             Processing result dictionary
         """
-        audio_path = None
         try:
             video_id = video.get('video_id')
             if not video_id:
                 return {"success": False, "error": "No video ID"}
             
+            if self._already_done(video_id):
+                self.logger.info(f"Video {video_id} already transcribed, skipping")
+                return self._cached_result(video)
+            
+            # Out-of-range lengths (e.g. long lives) are skipped before any download
+            skip = self._duration_skip(video)
+            if skip:
+                self.logger.info(f"Video {video_id} skipped: {skip['reason']}")
+                return skip
+            
             # Download audio
-            audio_path = self.download_audio(video)
-            if not audio_path:
+            if audio is None:
+                audio = self.fetch_audio(video)
+            if audio is None:
                 return {"success": False, "error": "Failed to download audio"}
             
             # Transcribe audio
-            transcription = self.transcribe_audio(audio_path)
-            
-            # Check if video has sufficient speech
-            if not transcription or len(transcription) < self.min_speech_threshold:
-                self.logger.info(f"Video {video_id} has minimal/no speech ({len(transcription) if transcription else 0} chars)")
-                return {
-                    "success": False,
-                    "skipped": True,
-                    "reason": "Minimal or no speech detected",
-                    "transcription_length": len(transcription) if transcription else 0
-                }
-            
-            # Save transcription
-            result = {
-                "success": True,
-                "video_id": video_id,
-                "title": video.get('title', ''),
-                "transcription": transcription,
-                "transcription_length": len(transcription),
-                "video_metadata": video,
-                "timestamp": datetime.now().isoformat()
-            }
+            transcription = self.transcribe_audio(audio)
             
-            self.save_transcription(video_id, result)
-            self.logger.info(f"Successfully transcribed video {video_id} ({len(transcription)} chars)")
-            
-            return result
+            return self._finalize_transcription(video, transcription)
             
         except Exception as e:
             self.logger.error(f"Error processing video {video.get('video_id')}: {e}")
             return {"success": False, "error": str(e)}
+    
+    def _finalize_transcription(self, video: Dict[str, Any], transcription: Optional[str]) -> Dict[str, Any]:
+        """
+        Apply the speech threshold to a transcription and save it
+        
+        Args:
+            video: Video metadata dictionary
+            transcription: Transcribed text (None if nothing was transcribed)
+            
+        Returns:
+            Processing result dictionary
+        """
+        video_id = video.get('video_id')
+        
+        # Check if video has sufficient speech
+        if not transcription or len(transcription) < self.min_speech_threshold:
+            self.logger.info(f"Video {video_id} has minimal/no speech ({len(transcription) if transcription else 0} chars)")
+            return {
+                "success": False,
+                "skipped": True,
+                "reason": "Minimal or no speech detected",
+                "transcription_length": len(transcription) if transcription else 0
+            }
+        
+        # Save transcription
+        result = {
+            "success": True,
+            "video_id": video_id,
+            "title": video.get('title', ''),
+            "transcription": transcription,
+            "transcription_length": len(transcription),
+            "video_metadata": video,
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        self.save_transcription(video_id, result)
+        self.logger.info(f"Successfully transcribed video {video_id} ({len(transcription)} chars)")
+        
+        return result
+    
+    def process_videos_batched(self, videos: List[Dict[str, Any]],
+                               batch_audio_seconds: int = 60) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Process videos by transcribing several of them in one Whisper call
+        
+        Decoded audio is concatenated (with 1s of silence between videos)
+        until at least batch_audio_seconds is buffered, transcribed once,
+        and the resulting segments are split back per video by start time.
+        This amortizes per-call overhead on short TikToks.
+        
+        Args:
+            videos: Video metadata dictionaries
+            batch_audio_seconds: Audio to accumulate before each Whisper call
+            
+        Yields:
+            (video, result) tuples, result shaped like process_single_video()
+        """
+        skipped, videos = self._split_by_duration(videos)
+        yield from skipped
+        
+        pending = []
+        pending_samples = 0
+        stop = threading.Event()
+        audio_queue = self._prefetch_audio(videos, stop)
+        
+        try:
+            while (item := audio_queue.get()) is not None:
+                video, audio = item
+                if audio is None:
+                    yield video, {"success": False, "error": "Failed to download audio"}
+                    continue
+                
+                pending.append((video, audio))
+                pending_samples += len(audio)
+                if pending_samples >= batch_audio_seconds * SAMPLE_RATE:
+                    yield from self._transcribe_concatenated(pending)
+                    pending = []
+                    pending_samples = 0
         finally:
-            # Always clean up audio file
-            if audio_path and os.path.exists(audio_path):
-                try:
-                    os.unlink(audio_path)
-                except Exception as e:
-                    self.logger.warning(f"Failed to delete temp audio file {audio_path}: {e}")
+            # Also runs when the caller abandons the iterator or raises
+            stop.set()
+        
+        if pending:
+            yield from self._transcribe_concatenated(pending)
+    
+    def _transcribe_concatenated(self, batch: List[Tuple[Dict[str, Any], np.ndarray]]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Transcribe (video, audio) pairs in a single Whisper call and split the segments per video"""
+        silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        chunks = []
+        starts = []
+        clips = []
+        offset = 0
+        for _, audio in batch:
+            starts.append(offset)
+            clips.extend(
+                {"start": offset + clip["start"], "end": offset + clip["end"]}
+                for clip in self._speech_clips(audio)
+            )
+            chunks.extend((audio, silence))
+            offset += len(audio) + len(silence)
+        
+        texts = [[] for _ in batch]
+        try:
+            # VAD runs per video above, so every chunk handed to Whisper lies
+            # inside one video; letting the pipeline run VAD over the joined
+            # audio would merge speech across videos into a single chunk
+            if clips:
+                segments, _ = self.batched_model.transcribe(
+                    np.concatenate(chunks),
+                    batch_size=int(os.getenv('WHISPER_BATCH', '8')),
+                    beam_size=int(os.getenv('WHISPER_BEAM', '1')),
+                    language="en",
+                    initial_prompt="This is a TikTok video transcription.",
+                    vad_filter=False,
+                    clip_timestamps=clips
+                )
+                for segment in segments:
+                    text = segment.text.strip()
+                    if text:
+                        # Half a second of slack absorbs rounding of the segment
+                        # start; the 1 s gap keeps it short of the next video
+                        position = int(segment.start * SAMPLE_RATE) + SAMPLE_RATE // 2
+                        owner = bisect.bisect_right(starts, position) - 1
+                        texts[max(owner, 0)].append(text)
+        except Exception as e:
+            self.logger.error(f"Failed to transcribe batch of {len(batch)} videos: {e}")
+            for video, _ in batch:
+                yield video, {"success": False, "error": str(e)}
+            return
+        
+        for (video, _), parts in zip(batch, texts):
+            try:
+                yield video, self._finalize_transcription(video, " ".join(parts) or None)
+            except Exception as e:
+                self.logger.error(f"Error processing video {video.get('video_id')}: {e}")
+                yield video, {"success": False, "error": str(e)}
+    
+    @staticmethod
+    def _speech_clips(audio: np.ndarray, max_clip_s: float = 30.0) -> List[Dict[str, int]]:
+        """
+        Group one video's VAD speech regions into Whisper-sized clips
+        
+        Args:
+            audio: 16 kHz mono samples of a single video
+            max_clip_s: Longest clip to emit (Whisper's window is 30 s)
+            
+        Returns:
+            List of {"start", "end"} sample offsets relative to the audio
+        """
+        max_samples = int(max_clip_s * SAMPLE_RATE)
+        speech = get_speech_timestamps(
+            audio, VadOptions(max_speech_duration_s=max_clip_s, **VAD_PARAMETERS)
+        )
+        clips = []
+        for ts in speech:
+            if clips and ts['end'] - clips[-1]['start'] <= max_samples:
+                clips[-1]['end'] = ts['end']
+            else:
+                clips.append({"start": ts['start'], "end": ts['end']})
+        return clips
+    
+    def _audio_ydl_opts(self) -> Dict[str, Any]:
+        """Build yt-dlp options for fetching a video's audio stream"""
+        # Add audio-specific options. The container is kept as downloaded:
+        # faster-whisper decodes m4a/webm/opus itself, so re-encoding to WAV
+        # would only add an extra ffmpeg pass
+        return {
+            **self._base_opts,
+            'format': 'bestaudio[ext=m4a]/bestaudio/best',
+            # Generic template (%(id)s is the video id) keeps the options identical
+            # across videos, so one cached YoutubeDL serves them all
+            'outtmpl': str(self.temp_dir / "%(id)s.%(ext)s"),
+        }
+    
+    def _ffmpeg_pcm(self, src: str, http_headers: Optional[Dict[str, str]] = None) -> np.ndarray:
+        """
+        Decode a file or URL to 16 kHz mono float32 samples through an ffmpeg pipe
+        
+        Args:
+            src: Local path or media URL
+            http_headers: Headers ffmpeg should send when src is a URL
+            
+        Returns:
+            Audio samples in [-1, 1)
+        """
+        cmd = ["ffmpeg", "-nostdin", "-loglevel", "error"]
+        if http_headers:
+            cmd += ["-headers", "".join(f"{k}: {v}\r\n" for k, v in http_headers.items())]
+        cmd += ["-i", src, "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", "1", "-"]
+        
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+    
+    def fetch_audio(self, video: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Fetch a video's audio as 16 kHz float32 samples
+        
+        The audio stream URL is resolved with yt-dlp and piped straight through
+        ffmpeg into memory, so nothing is written to temp_dir. If streaming
+        fails, the audio is downloaded with download_audio() and decoded from
+        the temp file instead.
+        
+        Args:
+            video: Video metadata dictionary
+            
+        Returns:
+            Audio samples or None if failed
+        """
+        video_id = video.get('video_id')
+        video_url = video.get('url')
+        if not video_url:
+            self.logger.error("No video URL provided")
+            return None
+        
+        try:
+            info = self._get_ydl(self._audio_opts).extract_info(video_url, download=False)
+            media_url = info.get('url') if info else None
+            if media_url:
+                headers = dict(info.get('http_headers') or {})
+                if info.get('cookies'):
+                    headers['Cookie'] = info['cookies']
+                self.logger.debug(f"Streaming audio for video {video_id}")
+                return self._ffmpeg_pcm(media_url, headers)
+        except Exception as e:
+            self.logger.warning(f"Streaming audio failed for {video_id}, downloading instead: {e}")
+        
+        audio_path = self.download_audio(video)
+        if not audio_path:
+            return None
+        try:
+            return self._ffmpeg_pcm(audio_path)
+        except Exception as e:
+            self.logger.error(f"Failed to decode audio for {video_id}: {e}")
+            return None
+        finally:
+            try:
+                os.unlink(audio_path)
+            except Exception as e:
+                self.logger.warning(f"Failed to delete temp audio file {audio_path}: {e}")
     
     def download_audio(self, video: Dict[str, Any]) -> Optional[str]:
         """
@@ -403,35 +992,19 @@ class TikTokTranscriber:
             
             video_id = video.get('video_id')
             
-            # Create temporary audio file path
-            audio_path = self.temp_dir / f"{video_id}.wav"
-            
-            # Build base options with headers and cookies
-            ydl_opts = self._build_ydl_opts()
-            
-            # Add audio-specific options
-            ydl_opts.update({
-                'format': 'bestaudio[ext=m4a]/bestaudio/best',
-                'outtmpl': str(audio_path).replace('.wav', '.%(ext)s'),
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'wav',
-                    'preferredquality': '192',
-                }],
-            })
+            # Options with headers, cookies and audio format selection
+            ydl_opts = self._audio_opts
             
             self.logger.debug(f"Downloading audio for video {video_id}")
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([video_url])
+            info = self._get_ydl(ydl_opts).extract_info(video_url, download=True)
             
-            # Check for downloaded audio file with different extensions
-            audio_extensions = ['.wav', '.m4a', '.mp3', '.webm', '.ogg', '.opus']
-            for ext in audio_extensions:
-                test_path = self.temp_dir / f"{video_id}{ext}"
-                if test_path.exists():
-                    self.logger.debug(f"Downloaded audio: {test_path}")
-                    return str(test_path)
+            # yt-dlp reports where it wrote the file, whatever the container
+            downloads = (info or {}).get('requested_downloads') or []
+            audio_path = downloads[0].get('filepath') if downloads else None
+            if audio_path:
+                self.logger.debug(f"Downloaded audio: {audio_path}")
+                return audio_path
             
             # If no audio file found, return None
             self.logger.error(f"No audio file found for video {video_id}")
@@ -441,37 +1014,61 @@ class TikTokTranscriber:
             self.logger.error(f"Failed to download audio for {video.get('video_id')}: {e}")
             return None
     
-    def transcribe_audio(self, audio_path: str) -> Optional[str]:
+    def transcribe_audio(self, audio: Union[str, np.ndarray]) -> Optional[str]:
         """
         Transcribe audio using faster-whisper
         
         Args:
-            audio_path: Path to audio file
+            audio: Path to audio file or 16 kHz float32 samples
             
         Returns:
             Transcribed text or None if failed
         """
         try:
-            if not self.whisper_model:
+            if not self.batched_model:
                 self.logger.error("Whisper model not initialized")
                 return None
             
-            # Transcribe audio
-            segments, info = self.whisper_model.transcribe(
-                audio_path,
-                beam_size=5,
+            # Decode once; the same samples feed VAD and Whisper
+            if isinstance(audio, str):
+                audio = decode_audio(audio, sampling_rate=SAMPLE_RATE)
+            
+            # Silence/music-only gate: Silero VAD is far cheaper than a Whisper
+            # pass, so skip videos with under a second of detected speech
+            speech = get_speech_timestamps(audio, VadOptions(min_speech_duration_ms=250))
+            speech_samples = sum(ts['end'] - ts['start'] for ts in speech)
+            if speech_samples < SAMPLE_RATE:
+                self.logger.info(f"VAD detected {speech_samples / SAMPLE_RATE:.2f}s of speech, skipping transcription")
+                return None
+            
+            # Transcribe audio (chunks are decoded in batches of WHISPER_BATCH).
+            # Greedy decoding by default - short single-speaker clips rarely
+            # benefit from a wider beam
+            segments, info = self.batched_model.transcribe(
+                audio,
+                batch_size=int(os.getenv('WHISPER_BATCH', '8')),
+                beam_size=int(os.getenv('WHISPER_BEAM', '1')),
                 language="en",  # You can detect language automatically
-                condition_on_previous_text=True,
-                initial_prompt="This is a TikTok video transcription."
+                initial_prompt="This is a TikTok video transcription.",
+                vad_filter=True,
+                vad_parameters=VAD_PARAMETERS
             )
+            full_text = self._join_segments(segments)
             
-            # Combine segments into full text
-            full_text = ""
-            for segment in segments:
-                full_text += segment.text + " "
-            
-            # Clean up text
-            full_text = full_text.strip()
+            # Low-confidence result on real audio: retry with beam search and
+            # temperature fallback before treating the video as speechless
+            if len(full_text) < self.min_speech_threshold and info.duration > 3:
+                self.logger.debug(f"Short greedy transcript ({len(full_text)} chars), retrying with beam_size=5")
+                segments, info = self.whisper_model.transcribe(
+                    audio,
+                    beam_size=5,
+                    temperature=[0.0, 0.2, 0.4],
+                    language="en",
+                    initial_prompt="This is a TikTok video transcription.",
+                    vad_filter=True,
+                    vad_parameters=VAD_PARAMETERS
+                )
+                full_text = self._join_segments(segments)
             
             if full_text:
                 self.logger.info(f"Transcribed {len(full_text)} characters")
@@ -484,30 +1081,74 @@ class TikTokTranscriber:
             self.logger.error(f"Failed to transcribe audio: {e}")
             return None
     
+    @staticmethod
+    def _join_segments(segments) -> str:
+        """Combine Whisper segments into full text (segments is a generator, so this streams)"""
+        return " ".join(
+            text for text in (segment.text.strip() for segment in segments) if text
+        )
+    
     def save_transcription(self, video_id: str, result: Dict[str, Any]):
-        """Save transcription to file"""
+        """
+        Save transcription to file
+        
+        Writes <video_id>_transcript.txt (read by search, topics and the API),
+        or, with write_txt disabled, appends one line to the account's
+        <username>_transcripts.jsonl through a single open file handle.
+        """
         try:
+            if not self.write_txt:
+                self._get_transcript_jsonl().write(json.dumps(result, default=str) + "\n")
+                self.logger.info(f"Saved transcription: {video_id} -> {self._transcript_jsonl.name}")
+                return
+            
             transcript_file = self.output_dir / f"{video_id}_transcript.txt"
             
+            # Header + body in a single write
+            content = (
+                f"# Transcription for Video {video_id}\n"
+                f"Title: {result.get('title', 'Unknown')}\n"
+                f"Timestamp: {result.get('timestamp')}\n"
+                + "=" * 50 + "\n\n"
+                + result.get('transcription', '')
+            )
             with open(transcript_file, 'w', encoding='utf-8') as f:
-                f.write(f"# Transcription for Video {video_id}\n")
-                f.write(f"Title: {result.get('title', 'Unknown')}\n")
-                f.write(f"Timestamp: {result.get('timestamp')}\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(result.get('transcription', ''))
+                f.write(content)
             
             self.logger.info(f"Saved transcription: {transcript_file}")
             
         except Exception as e:
             self.logger.error(f"Failed to save transcription: {e}")
     
+    def _get_transcript_jsonl(self) -> io.TextIOWrapper:
+        """Return the JSONL transcript file for the current output_dir, opening it on first use"""
+        path = self.output_dir / f"{self.output_dir.parent.name}_transcripts.jsonl"
+        if self._transcript_jsonl is None or self._transcript_jsonl.name != str(path):
+            self._close_transcript_jsonl()
+            self._transcript_jsonl = open(path, 'a', encoding='utf-8')
+        return self._transcript_jsonl
+    
+    def _close_transcript_jsonl(self):
+        """Flush and close the JSONL transcript file if one is open"""
+        if self._transcript_jsonl is not None:
+            self._transcript_jsonl.close()
+            self._transcript_jsonl = None
+    
     def save_results(self, username: str, results: Dict[str, Any]):
         """Save processing results to JSON file"""
         try:
             results_file = self.output_dir / f"{username}_results.json"
             
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                with open(results_file, 'wb') as f:
+                    f.write(orjson.dumps(
+                        results,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                        default=str
+                    ))
+            else:
+                with open(results_file, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, indent=2, default=str)
             
             self.logger.info(f"Saved results: {results_file}")
             
@@ -519,6 +1160,64 @@ class TikTokTranscriber:
         return self.stats.copy()
 
 
+# Per-process transcriber for --users pool workers (built by _init_account_worker)
+_WORKER_TRANSCRIBER: Optional[TikTokTranscriber] = None
+
+
+def _init_account_worker(transcriber_kwargs: Dict[str, Any]):
+    """Pool initializer: load this worker's own transcriber and Whisper model"""
+    global _WORKER_TRANSCRIBER
+    _WORKER_TRANSCRIBER = TikTokTranscriber(**transcriber_kwargs)
+
+
+def _process_account_worker(username: str) -> Tuple[str, Dict[str, Any]]:
+    """Pool worker: process one account with this worker's transcriber"""
+    return username, _WORKER_TRANSCRIBER.process_account(username)
+
+
+def _report_accounts(account_results, output_dir: str) -> List[str]:
+    """
+    Print per-account stats and, for multi-account runs, save a merged summary
+    
+    Args:
+        account_results: Iterable of (username, process_account() result)
+        output_dir: Base output directory
+        
+    Returns:
+        Usernames that failed
+    """
+    failed_users = []
+    summary = {}
+    for user, results in account_results:
+        summary[user.lstrip('@')] = {"error": results.get('error'), "stats": results.get('stats', {})}
+        
+        if results.get('error'):
+            print(f"\n❌ Error (@{user.lstrip('@')}): {results['error']}")
+            failed_users.append(user)
+            continue
+        
+        # Print stats
+        stats = results['stats']
+        print(f"\n{'='*60}")
+        print(f"✅ Processing Complete: @{user.lstrip('@')}")
+        print(f"{'='*60}")
+        print(f"Total videos found: {stats['total_videos']}")
+        print(f"Successfully processed: {stats['processed_videos']}")
+        print(f"Skipped (no speech): {stats['skipped_videos']}")
+        print(f"Failed: {stats['failed_videos']}")
+        print(f"Processing time: {stats['processing_time']:.2f}s")
+        print(f"Results saved to: {Path(output_dir) / user.lstrip('@') / 'transcriptions'}")
+        print(f"{'='*60}\n")
+    
+    if len(summary) > 1:
+        summary_file = Path(output_dir) / "transcription_summary.json"
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump({"accounts": summary, "timestamp": datetime.now().isoformat()}, f, indent=2, default=str)
+        print(f"Summary saved to: {summary_file}")
+    
+    return failed_users
+
+
 def main():
     """Main function for command-line usage"""
     import argparse
@@ -531,24 +1230,57 @@ Examples:
   python tiktok_transcriber.py --user kwrt_
   python tiktok_transcriber.py --user matrix.v5 --max-videos 20
   python tiktok_transcriber.py --user beabettermandaily --cookies cookies.txt
+  python tiktok_transcriber.py --users kwrt_,matrix.v5,garyvee --concurrency 3
+  cat test_accounts.txt | python tiktok_transcriber.py --batch
         """
     )
     
-    parser.add_argument('--user', '-u', required=True, help='TikTok username (with or without @)')
+    parser.add_argument('--user', '-u', help='TikTok username (with or without @)')
+    parser.add_argument('--users', help='Comma-separated TikTok usernames to process in parallel')
+    parser.add_argument('--concurrency', type=int, default=None,
+                       help='Accounts processed in parallel (default: half the CPU cores)')
+    parser.add_argument('--batch', action='store_true',
+                       help='Read usernames from stdin (one per line) and reuse the loaded model')
     parser.add_argument('--output-dir', default='accounts', help='Base output directory (default: accounts)')
     parser.add_argument('--model-size', default=None, choices=['tiny', 'small', 'medium', 'large'], 
                        help='Whisper model size (default: from env or "small")')
+    parser.add_argument('--compute-type', default=None,
+                       choices=['int8', 'int8_float16', 'float16', 'int8_float32'],
+                       help='Whisper compute type (default: from env or "int8")')
     parser.add_argument('--max-videos', type=int, default=None, 
                        help='Maximum videos to process (default: from env or 10)')
     parser.add_argument('--cookies', dest='cookies_file', default=None, 
                        help='Path to cookies.txt file for authenticated scraping')
+    parser.add_argument('--batch-audio-seconds', type=int, default=None,
+                       help='Transcribe several videos per Whisper call, up to this many seconds '
+                            'of audio (default: from env or 0 = one call per video)')
     parser.add_argument('--min-speech', type=int, default=50,
                        help='Minimum characters to consider video has speech (default: 50)')
+    parser.add_argument('--write-txt', action=argparse.BooleanOptionalAction, default=True,
+                       help='Write one <video_id>_transcript.txt per video (default). With '
+                            '--no-write-txt, append to <username>_transcripts.jsonl instead')
+    parser.add_argument('--force', action='store_true',
+                       help='Re-transcribe videos that already have a transcript')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     
     args = parser.parse_args()
     
+    if not (args.user or args.users or args.batch):
+        parser.error('one of --user, --users or --batch is required')
+    
+    users = []
+    if args.user:
+        users.append(args.user)
+    if args.users:
+        users.extend(u.strip() for u in args.users.split(',') if u.strip())
+    if args.batch:
+        users.extend(line.strip() for line in sys.stdin if line.strip() and not line.startswith('#'))
+    if not users:
+        parser.error('no usernames given')
+    
+    concurrency = min(len(users), args.concurrency or max(1, (os.cpu_count() or 2) // 2))
+    
     # Set log level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -556,41 +1288,46 @@ Examples:
     print(f"\n{'='*60}")
     print(f"TikTok Transcription Pipeline")
     print(f"{'='*60}")
-    print(f"Account: @{args.user.lstrip('@')}")
+    print(f"Account(s): {', '.join('@' + u.lstrip('@') for u in users)}")
     print(f"Max videos: {args.max_videos or os.getenv('MAX_VIDEOS', '10')}")
     print(f"Model size: {args.model_size or os.getenv('WHISPER_MODEL_SIZE', 'small')}")
     if args.cookies_file:
         print(f"Cookies: {args.cookies_file}")
     print(f"{'='*60}\n")
     
-    # Initialize transcriber
-    transcriber = TikTokTranscriber(
+    transcriber_kwargs = dict(
         output_dir=args.output_dir,
         model_size=args.model_size,
         max_videos=args.max_videos,
         cookies_file=args.cookies_file,
-        min_speech_threshold=args.min_speech
+        min_speech_threshold=args.min_speech,
+        compute_type=args.compute_type,
+        batch_audio_seconds=args.batch_audio_seconds,
+        write_txt=args.write_txt,
+        force=args.force
     )
     
-    # Process account
-    results = transcriber.process_account(args.user)
+    if concurrency > 1:
+        # Workers are spawned before any model exists and each loads its own, so
+        # no process inherits a CTranslate2 model whose thread pool did not
+        # survive a fork; cores are split so workers do not oversubscribe them
+        if not os.getenv('WHISPER_THREADS'):
+            transcriber_kwargs['cpu_threads'] = max(1, (os.cpu_count() or 4) // concurrency)
+        with multiprocessing.get_context("spawn").Pool(
+            processes=concurrency,
+            initializer=_init_account_worker,
+            initargs=(transcriber_kwargs,)
+        ) as pool:
+            account_results = pool.imap_unordered(_process_account_worker, users)
+            failed_users = _report_accounts(account_results, args.output_dir)
+    else:
+        # Initialize transcriber (model is loaded once and reused for every account)
+        with TikTokTranscriber(**transcriber_kwargs) as transcriber:
+            account_results = ((user, transcriber.process_account(user)) for user in users)
+            failed_users = _report_accounts(account_results, args.output_dir)
     
-    if results.get('error'):
-        print(f"\n❌ Error: {results['error']}")
+    if failed_users:
         sys.exit(1)
-    
-    # Print stats
-    stats = results.get('stats', transcriber.get_stats())
-    print(f"\n{'='*60}")
-    print(f"✅ Processing Complete!")
-    print(f"{'='*60}")
-    print(f"Total videos found: {stats['total_videos']}")
-    print(f"Successfully processed: {stats['processed_videos']}")
-    print(f"Skipped (no speech): {stats['skipped_videos']}")
-    print(f"Failed: {stats['failed_videos']}")
-    print(f"Processing time: {stats['processing_time']:.2f}s")
-    print(f"Results saved to: {transcriber.output_dir}")
-    print(f"{'='*60}\n")
 
 
 if __name__ == "__main__":
@@ -1,23 +1,28 @@
 #!/usr/bin/env python3
 """
 Topic Extraction Engine - Semantic topic extraction using embeddings
-Uses KeyBERT and sentence-transformers for real semantic understanding
+Uses KeyBERT-style keyword selection over sentence-transformers embeddings
 """
 
 import os
+import re
 import json
+import hashlib
+import itertools
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Set, Tuple
-from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Set, Tuple, Optional
 import numpy as np
 from sklearn.cluster import AgglomerativeClustering
+from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
 # NLP imports
 try:
-    from keybert import KeyBERT
+    import torch
     from sentence_transformers import SentenceTransformer
+    from sentence_transformers.models import Normalize, Pooling
     import nltk
     from nltk.corpus import stopwords
     HAS_NLP = True
@@ -25,6 +30,117 @@ except ImportError:
     HAS_NLP = False
     print("⚠️  NLP libraries not installed. Install with: pip install -r requirements.txt")
 
+# Optional SIMD cosine kernels
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+# Optional ONNX Runtime inference for the embedding model
+try:
+    import onnxruntime as ort
+    HAS_ORT = True
+except ImportError:
+    HAS_ORT = False
+
+
+# Optional faster JSON (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any):
+    """Write an indented JSON file, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _read_transcript(transcript_file: Path) -> str:
+    """Read a transcript file, dropping the header above the ===== separator"""
+    with open(transcript_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Extract transcription (after header)
+    if "=" * 50 in content:
+        return content.split("=" * 50, 1)[1].strip()
+    return content
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache for model artifacts (HERMES_CACHE_DIR, default ~/.cache/hermes)"""
+    return Path(os.getenv('HERMES_CACHE_DIR') or Path.home() / '.cache' / 'hermes')
+
+
+# Threads for concurrent tag/transcript file reads and writes
+IO_WORKERS = 8
+
+
+# Optional JIT for the MaxSum combination search
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True, nogil=True)
+    def _maxsum_combination(candidates: np.ndarray, top_n: int) -> np.ndarray:
+        """Indices of the top_n candidates least similar to each other"""
+        n = candidates.shape[0]
+        combination = np.arange(top_n)
+        best = combination.copy()
+        min_sim = np.inf
+        while True:
+            # Same float32 accumulation order as KeyBERT's max_sum_distance
+            sim = np.float32(0.0)
+            for a in range(top_n):
+                for b in range(top_n):
+                    if a != b:
+                        sim += candidates[combination[a], combination[b]]
+            if sim < min_sim:
+                min_sim = sim
+                best[:] = combination
+            
+            # Advance to the next combination in itertools.combinations order
+            i = top_n - 1
+            while i >= 0 and combination[i] == i + n - top_n:
+                i -= 1
+            if i < 0:
+                break
+            combination[i] += 1
+            for j in range(i + 1, top_n):
+                combination[j] = combination[j - 1] + 1
+        return best
+else:
+    def _maxsum_combination(candidates: np.ndarray, top_n: int) -> np.ndarray:
+        """Indices of the top_n candidates least similar to each other"""
+        min_sim = 100_000
+        best = None
+        for combination in itertools.combinations(range(len(candidates)), top_n):
+            sim = sum([candidates[i][j] for i in combination for j in combination if i != j])
+            if sim < min_sim:
+                best = combination
+                min_sim = sim
+        return np.array(best)
+
 
 # Predefined broad categories for account classification
 BROAD_CATEGORIES = [
@@ -57,19 +173,60 @@ class TopicExtractor:
             model_name: Sentence transformer model to use
         """
         if not HAS_NLP:
-            raise ImportError("NLP libraries required. Run: pip install keybert sentence-transformers nltk scikit-learn")
+            raise ImportError("NLP libraries required. Run: pip install sentence-transformers nltk scikit-learn")
         
         self.logger = logging.getLogger(__name__)
         
+        # Intra-op threads: 4-8 is the sweet spot, returns diminish beyond that
+        self.num_threads = int(os.getenv('TOPIC_THREADS', min(8, os.cpu_count() or 4)))
+        torch.set_num_threads(self.num_threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Can only be set once per process, before any inter-op work
+            pass
+        
         # Initialize models
         self.logger.info(f"Loading sentence transformer: {model_name}")
-        self.model = SentenceTransformer(model_name)
-        self.kw_model = KeyBERT(model=self.model)
-        
-        # Pre-compute category embeddings
-        self.category_embeddings = self.model.encode(BROAD_CATEGORIES)
+        self.model_name = model_name
+        self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        self.model = SentenceTransformer(model_name, device=self.device)
+        # Larger batches keep GPU tensor cores busy; CPU gains little past 32
+        self.encode_batch_size = 128 if self.device == 'cuda' else 32
+        # Exported from the FP32 weights, before any precision change below.
+        # A CPU-only onnxruntime build would pull GPU encoding back onto the
+        # CPU, so on CUDA the session is only used with the CUDA provider
+        use_ort = HAS_ORT and (
+            self.device == 'cpu' or 'CUDAExecutionProvider' in ort.get_available_providers()
+        )
+        self.ort_session = self._load_onnx_session(model_name) if use_ort else None
+        # Reduced precision: FP16 on GPU, dynamic int8 Linear layers on CPU
+        if self.device == 'cuda':
+            self.model = self.model.half()
+        elif self.ort_session is None:
+            self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+        
+        # Candidate 1-3 word phrases of alphabetic tokens (3+ chars, hyphens
+        # allowed). Reusing one instance skips the per-fit stop word check
+        self.vectorizer = CountVectorizer(
+            ngram_range=(1, 3),
+            stop_words='english',
+            token_pattern=r'(?u)\b[^\W\d_](?:[^\W\d_]|-){2,}\b'
+        )
+        
+        # Pre-computed category embeddings (persisted across runs)
+        self.category_embeddings = self._load_category_embeddings()
+        # Unit-normalize once so classification is a single matrix-vector product
+        self.category_embeddings = np.ascontiguousarray(
+            self.category_embeddings / np.linalg.norm(self.category_embeddings, axis=1, keepdims=True),
+            dtype=np.float32
+        )
         self.logger.debug(f"Pre-computed embeddings for {len(BROAD_CATEGORIES)} categories")
         
+        if HAS_NUMBA:
+            # Compile (or load the cached) MaxSum kernel up front
+            _maxsum_combination(np.zeros((2, 2), dtype=np.float32), 1)
+        
         # Download NLTK stopwords if needed
         try:
             self.stop_words = set(stopwords.words('english'))
@@ -97,6 +254,181 @@ class TopicExtractor:
         
         self.logger.info("Topic extractor initialized")
     
+    def _load_category_embeddings(self) -> np.ndarray:
+        """
+        Load BROAD_CATEGORIES embeddings from the user cache, encoding them once
+        
+        The cache file is keyed by model, inference backend and category list,
+        and stored as float16 (fresh embeddings are rounded the same way).
+        
+        Returns:
+            float32 category embeddings
+        """
+        backend = 'onnx' if self.ort_session is not None else self.device
+        key = hashlib.sha1(
+            '|'.join([self.model_name, backend] + BROAD_CATEGORIES).encode('utf-8')
+        ).hexdigest()[:12]
+        cache_dir = _user_cache_dir()
+        cat_file = cache_dir / f"cat_emb_{key}.npy"
+        
+        try:
+            embeddings = np.load(cat_file)
+            if embeddings.shape != (len(BROAD_CATEGORIES), self.model.get_sentence_embedding_dimension()):
+                raise ValueError("stale category embeddings")
+        except (OSError, ValueError):
+            embeddings = self._encode_smart(BROAD_CATEGORIES).astype(np.float16)
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                np.save(cat_file, embeddings)
+            except OSError as e:
+                self.logger.debug(f"Could not cache category embeddings: {e}")
+        
+        return embeddings.astype(np.float32)
+    
+    def _load_onnx_session(self, model_name: str):
+        """
+        Export the transformer to ONNX once and open an ONNX Runtime session
+        
+        Args:
+            model_name: Sentence transformer model name, used for the cache file
+            
+        Returns:
+            InferenceSession, or None to keep using PyTorch
+        """
+        pooling = self.model[1] if len(self.model) > 1 else None
+        if not isinstance(pooling, Pooling):
+            return None
+        pooling_mode = pooling.get_config_dict().get('pooling_mode') or pooling.get_pooling_mode_str()
+        if pooling_mode != 'mean':
+            return None
+        self._onnx_normalize = any(isinstance(module, Normalize) for module in self.model)
+        
+        cache_dir = Path(os.getenv('ONNX_CACHE_DIR') or _user_cache_dir() / 'onnx')
+        onnx_path = cache_dir / f"{model_name.strip('/').replace('/', '--')}.onnx"
+        
+        try:
+            if not onnx_path.exists():
+                self.logger.info(f"Exporting {model_name} to ONNX: {onnx_path}")
+                dummy = self.model.tokenizer(["hello world"], return_tensors='pt')
+                input_names = list(dummy)
+                
+                class LastHiddenState(torch.nn.Module):
+                    # Positional tensors in, token embeddings out, for the tracer
+                    def __init__(self, auto_model):
+                        super().__init__()
+                        self.auto_model = auto_model
+                    
+                    def forward(self, *inputs):
+                        return self.auto_model(**dict(zip(input_names, inputs)))[0]
+                
+                dynamic = {0: 'batch', 1: 'sequence'}
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = onnx_path.with_suffix('.onnx.tmp')
+                torch.onnx.export(
+                    LastHiddenState(self.model[0].auto_model),
+                    tuple(dummy[name] for name in input_names),
+                    str(tmp_path),
+                    input_names=input_names,
+                    output_names=['last_hidden_state'],
+                    dynamic_axes={**{name: dynamic for name in input_names}, 'last_hidden_state': dynamic},
+                    opset_version=17,
+                    dynamo=False
+                )
+                tmp_path.replace(onnx_path)
+            
+            sess_options = ort.SessionOptions()
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            sess_options.intra_op_num_threads = self.num_threads
+            providers = [
+                provider for provider in ('CUDAExecutionProvider', 'CPUExecutionProvider')
+                if provider in ort.get_available_providers()
+            ]
+            return ort.InferenceSession(str(onnx_path), sess_options, providers=providers)
+        except Exception as e:
+            self.logger.warning(f"ONNX Runtime unavailable, using PyTorch: {e}")
+            return None
+    
+    def _encode_onnx(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode one batch with ONNX Runtime (mean pooling, optional L2 norm)
+        
+        Args:
+            texts: Texts to encode
+            
+        Returns:
+            Sentence embeddings
+        """
+        features = self.model.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.model.max_seq_length,
+            return_tensors='np'
+        )
+        feeds = {
+            node.name: features[node.name].astype(np.int64)
+            for node in self.ort_session.get_inputs()
+        }
+        token_embeddings = self.ort_session.run(['last_hidden_state'], feeds)[0]
+        
+        mask = features['attention_mask'][..., None].astype(np.float32)
+        embeddings = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if self._onnx_normalize:
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings.astype(np.float32)
+    
+    def _encode_smart(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Encode texts in batches of similar token length
+        
+        Texts are sorted by tokenized length and each batch is encoded
+        separately, so padding only grows to the longest text in its own
+        batch rather than across wildly different transcript lengths.
+        
+        Args:
+            texts: Texts to encode
+            batch_size: Texts per forward pass (default: 128 on GPU, 32 on CPU)
+            
+        Returns:
+            float32 embeddings in the original text order
+        """
+        batch_size = batch_size or self.encode_batch_size
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, self.model.get_sentence_embedding_dimension()), dtype=np.float32)
+        
+        lengths = self.model.tokenizer(
+            texts,
+            truncation=True,
+            max_length=self.model.max_seq_length,
+            return_length=True
+        )['length']
+        order = np.argsort(lengths, kind='stable')
+        
+        # One encode() call per batch: encode() re-sorts whatever it is given
+        # by character length, which would undo the token-length bucketing
+        batches = [
+            [texts[i] for i in order[start:start + batch_size]]
+            for start in range(0, len(texts), batch_size)
+        ]
+        if self.ort_session is not None:
+            sorted_embeddings = np.vstack([self._encode_onnx(batch) for batch in batches])
+        else:
+            sorted_embeddings = np.vstack([
+                self.model.encode(
+                    batch,
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                )
+                for batch in batches
+            ])
+        
+        # FP16 models return float16; keep downstream similarity in float32
+        embeddings = np.empty(sorted_embeddings.shape, dtype=np.float32)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+    
     def extract_video_tags(self, 
                           transcript: str,
                           min_tags: int = 3,
@@ -114,44 +446,238 @@ class TopicExtractor:
         Returns:
             List of tags with scores
         """
-        if not transcript or len(transcript) < 50:
-            self.logger.warning("Transcript too short for tag extraction")
-            return []
+        return self.extract_tags_batch([transcript], min_tags, max_tags, diversity)[0]
+    
+    def extract_tags_batch(self,
+                           transcripts: List[str],
+                           min_tags: int = 3,
+                           max_tags: int = 10,
+                           diversity: float = 0.5,
+                           cache_dir: Optional[Path] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Extract semantic tags from many transcripts in one batch
         
-        try:
-            # Extract keywords using MaxSum for diversity
-            keywords = self.kw_model.extract_keywords(
-                transcript,
-                keyphrase_ngram_range=(1, 3),  # 1-3 word phrases
-                stop_words='english',
-                use_maxsum=True,
-                nr_candidates=20,
-                top_n=max_tags,
-                diversity=diversity
-            )
-            
-            # Convert to tag format
-            tags = []
-            for keyword, score in keywords:
-                # Skip if too short or just stopwords
-                if len(keyword.split()) == 1 and keyword.lower() in self.stop_words:
-                    continue
-                
-                tags.append({
-                    "tag": keyword,
-                    "score": float(score),
-                    "type": "keyphrase"
-                })
+        Candidate n-grams shared between transcripts are embedded once for
+        the whole batch instead of once per video, and transcripts that only
+        differ in case or whitespace are tagged once.
+        
+        Args:
+            transcripts: Video transcript texts
+            min_tags: Minimum number of tags to extract
+            max_tags: Maximum number of tags to extract
+            diversity: Diversity of tags (0-1, higher = more diverse)
+            cache_dir: Directory for content-addressed embedding cache (None = no cache)
             
-            # Ensure minimum tags
-            if len(tags) < min_tags:
-                self.logger.warning(f"Only extracted {len(tags)} tags (min: {min_tags})")
+        Returns:
+            List of tag lists, aligned with transcripts
+        """
+        results = [[] for _ in transcripts]
+        
+        # Only transcripts long enough to tag go into the batch, grouped by
+        # normalized content so repeated templates are embedded once
+        groups: Dict[str, List[int]] = {}
+        for i, transcript in enumerate(transcripts):
+            if not transcript or len(transcript) < 50:
+                self.logger.warning("Transcript too short for tag extraction")
+            else:
+                canon = re.sub(r'\s+', ' ', transcript.lower()).strip()
+                groups.setdefault(hashlib.sha1(canon.encode('utf-8')).hexdigest(), []).append(i)
+        
+        if not groups:
+            return results
+        
+        batch_indices = list(groups.values())
+        docs = [transcripts[indices[0]] for indices in batch_indices]
+        try:
+            df = self.vectorizer.fit_transform(docs)
+            words = self.vectorizer.get_feature_names_out()
             
-            return tags[:max_tags]
+            # Drop candidates made only of (NLTK) stopwords before embedding them
+            keep = np.array([
+                not all(token in self.stop_words for token in word.split())
+                for word in words
+            ], dtype=bool)
+            words = words[keep]
+            df = df[:, keep]
+            # fit_transform remaps columns in place; restore the per-row column
+            # order transform() (and so KeyBERT) produces, which MaxSum ties follow
+            df.sort_indices()
             
+            if cache_dir is not None:
+                doc_embeddings, word_embeddings = self._cached_embeddings(docs, words, df, Path(cache_dir))
+            else:
+                doc_embeddings = self._encode_smart(docs)
+                word_embeddings = self._encode_smart(words.tolist())
         except Exception as e:
             self.logger.error(f"Error extracting tags: {e}")
+            return results
+        
+        def select_keywords(doc_index: int) -> List[Tuple[str, float]]:
+            candidate_indices = df[doc_index].nonzero()[1]
+            try:
+                # Extract keywords using MaxSum for diversity
+                return self._max_sum_distance(
+                    doc_embeddings[doc_index].reshape(1, -1),
+                    word_embeddings[candidate_indices],
+                    [words[j] for j in candidate_indices],
+                    top_n=max_tags,
+                    nr_candidates=20
+                )
+            except ValueError:
+                return []
+        
+        if HAS_NUMBA and len(docs) > 1:
+            # The compiled kernel releases the GIL, so documents select in parallel
+            with ThreadPoolExecutor(max_workers=min(self.num_threads, len(docs))) as executor:
+                keywords_per_doc = list(executor.map(select_keywords, range(len(docs))))
+        else:
+            keywords_per_doc = [select_keywords(doc_index) for doc_index in range(len(docs))]
+        
+        for indices, keywords in zip(batch_indices, keywords_per_doc):
+            for i in indices:
+                results[i] = self._keywords_to_tags(keywords, min_tags, max_tags)
+        
+        return results
+    
+    def _max_sum_distance(self,
+                          doc_embedding: np.ndarray,
+                          word_embeddings: np.ndarray,
+                          words: List[str],
+                          top_n: int,
+                          nr_candidates: int) -> List[Tuple[str, float]]:
+        """
+        KeyBERT's Max Sum Distance selection with a compiled combination search
+        
+        Takes the nr_candidates phrases closest to the document, then the
+        top_n of those least similar to each other.
+        
+        Args:
+            doc_embedding: Document embedding (1 x dim)
+            word_embeddings: Embeddings of the document's candidate phrases
+            words: Candidate phrases
+            top_n: Number of keywords to return
+            nr_candidates: Number of closest candidates to choose from
+            
+        Returns:
+            (keyword, similarity) pairs
+        """
+        if nr_candidates < top_n:
+            raise ValueError("nr_candidates must be at least top_n")
+        if top_n > len(words):
             return []
+        
+        distances = cosine_similarity(doc_embedding, word_embeddings)
+        words_idx = distances.argsort()[0][-nr_candidates:]
+        candidates = np.ascontiguousarray(
+            cosine_similarity(word_embeddings[words_idx]),
+            dtype=np.float32
+        )
+        
+        best = _maxsum_combination(candidates, top_n)
+        return [
+            (words[words_idx[idx]], round(float(distances[0][words_idx[idx]]), 4))
+            for idx in best
+        ]
+    
+    def _cached_embeddings(self, docs: List[str], words: np.ndarray, df, cache_dir: Path) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Document and candidate embeddings for a batch, cached per transcript
+        
+        Each transcript is keyed by the sha256 of model name + text and stores
+        its document embedding and the embeddings of its own candidate n-grams
+        ({hash}_doc.npy / {hash}_cands.npy). Only transcripts missing from the
+        cache, and candidates not covered by a cached transcript, are encoded.
+        Entries are stored as float16; fresh embeddings are rounded the same
+        way so cold and warm runs select identical tags.
+        
+        Args:
+            docs: Transcripts in the batch
+            words: Candidate vocabulary for the batch
+            df: Document-term matrix of docs over words
+            cache_dir: Cache directory
+            
+        Returns:
+            (doc_embeddings, word_embeddings) aligned with docs and words
+        """
+        dim = self.model.get_sentence_embedding_dimension()
+        doc_embeddings = np.empty((len(docs), dim), dtype=np.float32)
+        word_embeddings = np.empty((len(words), dim), dtype=np.float32)
+        have_word = np.zeros(len(words), dtype=bool)
+        
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        misses = []
+        for i, doc in enumerate(docs):
+            digest = hashlib.sha256(f"{self.model_name}\n{doc}".encode('utf-8')).hexdigest()
+            doc_file = cache_dir / f"{digest}_doc.npy"
+            cands_file = cache_dir / f"{digest}_cands.npy"
+            candidate_indices = np.sort(df[i].nonzero()[1])
+            
+            try:
+                doc_embedding = np.load(doc_file)
+                cand_embeddings = np.load(cands_file)
+                if cand_embeddings.shape != (len(candidate_indices), dim):
+                    raise ValueError("stale candidate embeddings")
+            except (OSError, ValueError):
+                misses.append((i, doc_file, cands_file, candidate_indices))
+                continue
+            
+            # Refresh mtime so eviction drops least recently used entries
+            os.utime(doc_file)
+            os.utime(cands_file)
+            doc_embeddings[i] = doc_embedding
+            word_embeddings[candidate_indices] = cand_embeddings
+            have_word[candidate_indices] = True
+        
+        if misses:
+            doc_embeddings[[m[0] for m in misses]] = self._encode_smart(
+                [docs[m[0]] for m in misses]
+            ).astype(np.float16)
+            missing_words = np.flatnonzero(~have_word)
+            if len(missing_words):
+                word_embeddings[missing_words] = self._encode_smart(
+                    words[missing_words].tolist()
+                ).astype(np.float16)
+            
+            for i, doc_file, cands_file, candidate_indices in misses:
+                np.save(doc_file, doc_embeddings[i].astype(np.float16))
+                np.save(cands_file, word_embeddings[candidate_indices].astype(np.float16))
+            
+            self._evict_embedding_cache(cache_dir)
+        
+        self.logger.debug(f"Embedding cache: {len(docs) - len(misses)}/{len(docs)} transcripts hit")
+        return doc_embeddings, word_embeddings
+    
+    def _evict_embedding_cache(self, cache_dir: Path):
+        """Delete least recently used cache entries above EMB_CACHE_MAX_MB"""
+        max_bytes = int(os.getenv('EMB_CACHE_MAX_MB', '512')) * 1024 * 1024
+        files = [(f.stat().st_mtime, f.stat().st_size, f) for f in cache_dir.glob('*.npy')]
+        total = sum(size for _, size, _ in files)
+        
+        for _, size, path in sorted(files, key=lambda entry: entry[0]):
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+    
+    def _keywords_to_tags(self, keywords: List[Tuple[str, float]], min_tags: int, max_tags: int) -> List[Dict[str, Any]]:
+        """Convert KeyBERT (keyword, score) pairs to tag dictionaries"""
+        tags = []
+        for keyword, score in keywords:
+            # Skip if too short or just stopwords
+            if len(keyword.split()) == 1 and keyword.lower() in self.stop_words:
+                continue
+            
+            tags.append({
+                "tag": keyword,
+                "score": float(score),
+                "type": "keyphrase"
+            })
+        
+        # Ensure minimum tags
+        if len(tags) < min_tags:
+            self.logger.warning(f"Only extracted {len(tags)} tags (min: {min_tags})")
+        
+        return tags[:max_tags]
     
     def aggregate_account_tags(self, 
                               video_tags: List[Dict[str, Any]],
@@ -166,53 +692,59 @@ class TopicExtractor:
         Returns:
             Aggregated tags with rankings
         """
-        tag_counts = Counter()
-        tag_scores = defaultdict(list)
-        tag_videos = defaultdict(list)
-        
-        # Create video_id -> metadata mapping
+        # One row per (tag, video) occurrence
+        rows = [
+            (tag_item['tag'], tag_item['score'], video_tag_data.get('video_id'))
+            for video_tag_data in video_tags
+            for tag_item in video_tag_data.get('tags', [])
+        ]
+        if not rows:
+            return {"total_tags": 0, "total_videos": len(video_tags), "tags": []}
+        tags, scores, video_ids = zip(*rows)
+        
+        # Integer ids (first-seen order) and a CSR layout: rows of tag t are
+        # order[offsets[t]:offsets[t + 1]], in their original order
+        tag_ids, tag_names = pd.factorize(np.asarray(tags, dtype=object))
+        video_codes, video_names = pd.factorize(np.asarray(video_ids, dtype=object))
+        order = np.argsort(tag_ids, kind='stable')
+        offsets = np.searchsorted(tag_ids[order], np.arange(len(tag_names) + 1))
+        tag_video_ids = video_codes[order].astype(np.int32)
+        
+        # View count per distinct video (if metadata available), scanned once.
+        # Missing video_ids get code -1, which indexes the trailing slot
         video_meta_map = {v['video_id']: v for v in video_metadata}
-        
-        # Aggregate tags
-        for video_tag_data in video_tags:
-            video_id = video_tag_data.get('video_id')
-            for tag_item in video_tag_data.get('tags', []):
-                tag = tag_item['tag']
-                score = tag_item['score']
-                
-                tag_counts[tag] += 1
-                tag_scores[tag].append(score)
-                tag_videos[tag].append(video_id)
+        views = np.fromiter(
+            (video_meta_map.get(video_id, {}).get('view_count', 0) or 0 for video_id in video_names),
+            dtype=np.int64,
+            count=len(video_names)
+        )
+        views = np.append(views, 0)
+        video_names = np.append(np.asarray(video_names, dtype=object), None)
         
         # Calculate weighted scores
-        ranked_tags = []
-        for tag, count in tag_counts.items():
-            avg_score = np.mean(tag_scores[tag])
-            
-            # Calculate engagement weight (if metadata available)
-            engagement_weight = 1.0
-            total_views = 0
-            for video_id in tag_videos[tag]:
-                if video_id in video_meta_map:
-                    total_views += video_meta_map[video_id].get('view_count', 0)
-            
-            if total_views > 0:
-                engagement_weight = 1 + (np.log1p(total_views) / 20)  # Logarithmic scaling
-            
-            # Combined score: frequency × avg_score × engagement
-            combined_score = count * avg_score * engagement_weight
-            
-            ranked_tags.append({
-                "tag": tag,
-                "frequency": count,
-                "avg_score": float(avg_score),
-                "engagement_weight": float(engagement_weight),
-                "combined_score": float(combined_score),
-                "video_ids": tag_videos[tag]
-            })
+        frequency = np.diff(offsets)
+        avg_score = np.add.reduceat(np.asarray(scores, dtype=float)[order], offsets[:-1]) / frequency
+        total_views = np.add.reduceat(views[tag_video_ids], offsets[:-1])
+        engagement_weight = np.where(
+            total_views > 0,
+            1 + (np.log1p(np.clip(total_views, 0, None)) / 20),  # Logarithmic scaling
+            1.0
+        )
+        # Combined score: frequency × avg_score × engagement
+        combined_score = frequency * avg_score * engagement_weight
         
         # Sort by combined score
-        ranked_tags.sort(key=lambda x: x['combined_score'], reverse=True)
+        ranked_tags = [
+            {
+                "tag": tag_names[t],
+                "frequency": int(frequency[t]),
+                "avg_score": float(avg_score[t]),
+                "engagement_weight": float(engagement_weight[t]),
+                "combined_score": float(combined_score[t]),
+                "video_ids": video_names[tag_video_ids[offsets[t]:offsets[t + 1]]].tolist()
+            }
+            for t in np.argsort(-combined_score, kind='stable')
+        ]
         
         return {
             "total_tags": len(ranked_tags),
@@ -239,16 +771,21 @@ class TopicExtractor:
             tags_to_use = top_tags[:top_n]
             
             # Generate embeddings for top tags
-            tag_embeddings = self.model.encode(tags_to_use)
+            tag_embeddings = self._encode_smart(tags_to_use)
             
             # Compute average embedding (represents account's semantic space)
             account_embedding = np.mean(tag_embeddings, axis=0)
             
             # Compute cosine similarity with each category
-            similarities = cosine_similarity(
-                account_embedding.reshape(1, -1),
-                self.category_embeddings
-            )[0]
+            account_embedding = account_embedding / np.sqrt(np.vdot(account_embedding, account_embedding))
+            if HAS_SIMSIMD:
+                similarities = 1 - np.asarray(simsimd.cdist(
+                    account_embedding.reshape(1, -1).astype(np.float32),
+                    self.category_embeddings,
+                    metric='cosine'
+                )).ravel()
+            else:
+                similarities = self.category_embeddings @ account_embedding
             
             # Find best match
             best_idx = np.argmax(similarities)
@@ -271,6 +808,27 @@ class TopicExtractor:
             return {"category": "Unknown", "confidence": 0.0}
 
 
+# Loaded extractors keyed by model name, shared by every AccountTopicManager
+# in the process so the embedding model is only loaded once
+_EXTRACTOR_CACHE: Dict[str, TopicExtractor] = {}
+
+
+def get_extractor(model_name: str = "all-MiniLM-L6-v2") -> TopicExtractor:
+    """
+    Get the process-wide TopicExtractor for a model, loading it on first use
+    
+    Args:
+        model_name: Sentence transformer model to use
+        
+    Returns:
+        Shared TopicExtractor
+    """
+    extractor = _EXTRACTOR_CACHE.get(model_name)
+    if extractor is None:
+        extractor = _EXTRACTOR_CACHE.setdefault(model_name, TopicExtractor(model_name))
+    return extractor
+
+
 class AccountTopicManager:
     """Manage tags and category for a TikTok account"""
     
@@ -295,7 +853,7 @@ class AccountTopicManager:
         self.logger = logging.getLogger(__name__)
         
         # Initialize tag extractor
-        self.extractor = TopicExtractor()
+        self.extractor = get_extractor()
     
     def extract_all_topics(self, force: bool = False) -> Dict[str, Any]:
         """
@@ -311,8 +869,7 @@ class AccountTopicManager:
         if not self.index_file.exists():
             raise FileNotFoundError(f"Index file not found: {self.index_file}")
         
-        with open(self.index_file, 'r') as f:
-            index = json.load(f)
+        index = _read_json(self.index_file)
         
         processed_videos = index.get('processed_videos', {})
         
@@ -327,6 +884,9 @@ class AccountTopicManager:
         
         self.logger.info(f"Extracting tags for {len(processed_videos)} videos...")
         
+        # First pass: find cached tags and transcripts that need extraction
+        existing_files = []
+        to_read = []  # (video_id, video_data, tag_file, transcript_file)
         for video_id, video_data in processed_videos.items():
             if not video_data.get('success'):
                 results['skipped'] += 1
@@ -337,11 +897,7 @@ class AccountTopicManager:
             if tag_file.exists() and not force:
                 self.logger.debug(f"Tags already exist for {video_id}, skipping")
                 results['skipped'] += 1
-                
-                # Load existing tags
-                with open(tag_file, 'r') as f:
-                    existing_tags = json.load(f)
-                    results['video_tags'].append(existing_tags)
+                existing_files.append(tag_file)
                 continue
             
             # Load transcript
@@ -351,38 +907,50 @@ class AccountTopicManager:
                 results['failed'] += 1
                 continue
             
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            to_read.append((video_id, video_data, tag_file, transcript_file))
+        
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            # Existing tags and transcripts are read concurrently
+            existing_tags = executor.map(_read_json, existing_files)
+            transcripts = executor.map(_read_transcript, [item[3] for item in to_read])
+            results['video_tags'].extend(existing_tags)
+            pending = [
+                (video_id, video_data, tag_file, transcript)
+                for (video_id, video_data, tag_file, _), transcript in zip(to_read, transcripts)
+            ]
             
-            # Extract transcription (after header)
-            if "=" * 50 in content:
-                transcript = content.split("=" * 50, 1)[1].strip()
+            # Second pass: extract tags for all pending transcripts in one batch
+            if pending:
+                batch_tags = self.extractor.extract_tags_batch(
+                    [item[3] for item in pending],
+                    cache_dir=self.topics_dir / "_emb_cache"
+                )
             else:
-                transcript = content
+                batch_tags = []
             
-            # Extract tags
-            try:
-                tags = self.extractor.extract_video_tags(transcript)
-                
+            # Save tags, writing files concurrently
+            writes = []
+            for (video_id, video_data, tag_file, _), tags in zip(pending, batch_tags):
                 video_tags = {
                     "video_id": video_id,
                     "title": video_data.get('title', ''),
                     "tags": tags,
                     "extracted_at": pd.Timestamp.now().isoformat()
                 }
-                
-                # Save tags
-                with open(tag_file, 'w') as f:
-                    json.dump(video_tags, f, indent=2)
-                
-                results['extracted'] += 1
-                results['video_tags'].append(video_tags)
-                
-                self.logger.info(f"Extracted {len(tags)} tags for video {video_id}")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to extract tags for {video_id}: {e}")
-                results['failed'] += 1
+                writes.append((video_id, video_tags, executor.submit(_write_json, tag_file, video_tags)))
+            
+            for video_id, video_tags, future in writes:
+                try:
+                    future.result()
+                    
+                    results['extracted'] += 1
+                    results['video_tags'].append(video_tags)
+                    
+                    self.logger.info(f"Extracted {len(video_tags['tags'])} tags for video {video_id}")
+                    
+                except Exception as e:
+                    self.logger.error(f"Failed to extract tags for {video_id}: {e}")
+                    results['failed'] += 1
         
         # Generate account-level aggregations
         if results['video_tags']:
@@ -397,8 +965,7 @@ class AccountTopicManager:
         
         # Save account tags
         account_tags_file = self.topics_dir / "account_tags.json"
-        with open(account_tags_file, 'w') as f:
-            json.dump(account_tags, f, indent=2)
+        _write_json(account_tags_file, account_tags)
         
         self.logger.info(f"Saved account tags: {account_tags['total_tags']} unique tags")
         
@@ -408,8 +975,7 @@ class AccountTopicManager:
         
         # Save account category
         category_file = self.topics_dir / "account_category.json"
-        with open(category_file, 'w') as f:
-            json.dump(category, f, indent=2)
+        _write_json(category_file, category)
         
         self.logger.info(f"Classified as '{category['category']}' (confidence: {category['confidence']:.2f})")
 
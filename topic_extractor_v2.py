@@ -14,27 +14,130 @@ Improvements:
 import os
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Set, Tuple, Optional
-from collections import Counter, defaultdict
+from typing import List, Dict, Any, Set, FrozenSet, Tuple, Optional
+from collections import Counter, OrderedDict
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.cluster import AgglomerativeClustering
-from dataclasses import dataclass, asdict
-import re
+from dataclasses import dataclass
 from difflib import SequenceMatcher
 
 # NLP imports
 try:
     import spacy
+    from spacy.cli import download as spacy_download
     from sentence_transformers import SentenceTransformer
-    from keybert import KeyBERT
-    import nltk
-    from nltk.corpus import stopwords
     HAS_NLP = True
 except ImportError:
     HAS_NLP = False
-    print("⚠️  NLP libraries not installed. Install with: pip install spacy sentence-transformers keybert nltk")
+    print("⚠️  NLP libraries not installed. Install with: pip install spacy sentence-transformers")
+
+# Optional SIMD dot-product kernels
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+# Optional C edit distance (falls back to difflib)
+try:
+    from rapidfuzz.distance import Levenshtein
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# Optional faster JSON (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Pre-quantized int8 weights published alongside sentence-transformers hub models
+INT8_MODEL_FILES = {
+    "onnx": "onnx/model_qint8_avx512_vnni.onnx",
+    "openvino": "openvino/openvino_model_qint8_quantized.xml",
+}
+
+# spaCy components not needed for noun-phrase / entity extraction; excluded
+# components are never loaded. senter is redundant with the parser's sentences.
+SPACY_EXCLUDED_PIPES = ["textcat", "senter"]
+
+# Threads extracting and saving videos concurrently in extract_account_topics_v2
+V2_WORKERS = int(os.getenv('TOPIC_V2_WORKERS', min(4, os.cpu_count() or 1)))
+
+# spaCy tokens per document chunk, keeping each chunk inside the sentence
+# transformer's max sequence length (256 word pieces for MiniLM)
+DOC_CHUNK_TOKENS = 200
+
+# Max candidate phrase embeddings kept in memory across videos
+PHRASE_EMB_CACHE_SIZE = int(os.getenv('PHRASE_EMB_CACHE_SIZE', '50000'))
+
+
+# Loaded spaCy pipelines keyed by model name, shared by every TopicExtractorV2
+# in the process so each pipeline is only loaded (or downloaded) once
+_NLP_CACHE: Dict[str, Any] = {}
+
+
+def _load_spacy(spacy_model: str) -> "spacy.language.Language":
+    """Get the process-wide spaCy pipeline for a model, downloading it on first use"""
+    nlp = _NLP_CACHE.get(spacy_model)
+    if nlp is not None:
+        return nlp
+    
+    # parser (noun_chunks), ner (entities) and lemmatizer (with the
+    # attribute_ruler POS mapping it depends on) are all used
+    try:
+        nlp = spacy.load(spacy_model, exclude=SPACY_EXCLUDED_PIPES)
+    except OSError:
+        logging.getLogger(__name__).warning(f"spaCy model {spacy_model} not found. Downloading...")
+        spacy_download(spacy_model)
+        nlp = spacy.load(spacy_model, exclude=SPACY_EXCLUDED_PIPES)
+    
+    return _NLP_CACHE.setdefault(spacy_model, nlp)
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any):
+    """Write an indented JSON file, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance with rapidfuzz, else approximated from difflib's alignment"""
+    if HAS_RAPIDFUZZ:
+        return Levenshtein.distance(a, b)
+    return sum(
+        max(i2 - i1, j2 - j1)
+        for tag, i1, i2, j1, j2 in SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+        if tag != 'equal'
+    )
+
+
+def _dot_scores(matrix: np.ndarray, vector: np.ndarray) -> np.ndarray:
+    """Dot product of each row of matrix with vector, with simsimd when available"""
+    if HAS_SIMSIMD:
+        return np.asarray(simsimd.cdist(
+            matrix,
+            vector.reshape(1, -1),
+            metric='dot'
+        )).ravel()
+    return matrix @ vector
 
 
 @dataclass
@@ -72,7 +175,8 @@ class TopicExtractorV2:
     def __init__(self, 
                  model_name: str = "all-MiniLM-L6-v2",
                  spacy_model: str = "en_core_web_sm",
-                 config_dir: str = "config"):
+                 config_dir: str = "config",
+                 st_backend: str = "onnx"):
         """
         Initialize enhanced topic extractor
         
@@ -80,35 +184,62 @@ class TopicExtractorV2:
             model_name: Sentence transformer model
             spacy_model: spaCy model for NLP
             config_dir: Directory containing config files
+            st_backend: Sentence transformer backend: onnx, openvino or torch
         """
         if not HAS_NLP:
             raise ImportError("NLP libraries required")
         
         self.logger = logging.getLogger(__name__)
         self.config_dir = Path(config_dir)
+        self.model_name = model_name
         
         # Load models
         self.logger.info(f"Loading models: {model_name}, {spacy_model}")
-        self.st_model = SentenceTransformer(model_name)
+        self.st_model = self._load_sentence_model(model_name, st_backend)
         
-        try:
-            self.nlp = spacy.load(spacy_model)
-        except OSError:
-            self.logger.warning(f"spaCy model {spacy_model} not found. Downloading...")
-            os.system(f"python -m spacy download {spacy_model}")
-            self.nlp = spacy.load(spacy_model)
+        self.nlp = _load_spacy(spacy_model)
         
         # Load configurations
         self.stop_phrases = self._load_stop_phrases()
         self.canonical_map = self._load_canonical_map()
+        self._merge_rules = self.canonical_map.get("merge_rules", {})
+        
+        # LRU cache of normalized candidate phrase embeddings (float16), shared across videos
+        self._phrase_emb_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._phrase_emb_lock = threading.Lock()
+        
+        # The HF fast tokenizer behind st_model is not safe for concurrent use
+        # ("Already borrowed"), so encode calls from worker threads take turns
+        self._encode_lock = threading.Lock()
         
         self.logger.info("TopicExtractorV2 initialized")
     
-    def _load_stop_phrases(self) -> Set[str]:
+    def _load_sentence_model(self, model_name: str, st_backend: str) -> "SentenceTransformer":
+        """
+        Load the sentence transformer, preferring int8 weights on onnx/openvino
+        
+        Falls back to the backend's default (fp32) export, then to torch, when
+        the quantized file or the backend's runtime is not available.
+        """
+        if st_backend != "torch":
+            int8_file = INT8_MODEL_FILES.get(st_backend)
+            attempts = [{"file_name": int8_file}, None] if int8_file else [None]
+            if int8_file is None:
+                self.logger.warning(f"Unknown backend {st_backend!r}, no int8 weights to try")
+            for model_kwargs in attempts:
+                try:
+                    return SentenceTransformer(model_name, backend=st_backend, model_kwargs=model_kwargs)
+                except Exception as e:
+                    self.logger.debug(f"{st_backend} backend ({model_kwargs}) unavailable: {e}")
+            self.logger.warning(f"{st_backend} backend unavailable for {model_name}, using torch")
+        
+        return SentenceTransformer(model_name)
+    
+    def _load_stop_phrases(self) -> FrozenSet[str]:
         """Load stop phrases from config"""
         stop_file = self.config_dir / "stop_phrases.txt"
         if not stop_file.exists():
-            return set()
+            return frozenset()
         
         stop_phrases = set()
         with open(stop_file, 'r') as f:
@@ -118,7 +249,7 @@ class TopicExtractorV2:
                     stop_phrases.add(line.lower())
         
         self.logger.info(f"Loaded {len(stop_phrases)} stop phrases")
-        return stop_phrases
+        return frozenset(stop_phrases)
     
     def _load_canonical_map(self) -> Dict[str, Any]:
         """Load canonical topic mappings"""
@@ -129,14 +260,13 @@ class TopicExtractorV2:
         with open(canon_file, 'r') as f:
             return json.load(f)
     
-    def _extract_noun_phrases(self, text: str) -> List[Tuple[str, int, int]]:
+    def _extract_noun_phrases(self, doc: "spacy.tokens.Doc") -> List[Tuple[str, int, int]]:
         """
-        Extract noun phrases using spaCy
+        Extract noun phrases from a parsed spaCy Doc
         
         Returns:
             List of (phrase, start_char, end_char) tuples
         """
-        doc = self.nlp(text)
         noun_phrases = []
         
         for chunk in doc.noun_chunks:
@@ -168,14 +298,191 @@ class TopicExtractorV2:
         phrase_lower = phrase.lower().strip()
         
         # Check merge rules
-        merge_rules = self.canonical_map.get("merge_rules", {})
-        if phrase_lower in merge_rules:
-            return merge_rules[phrase_lower]
+        return self._merge_rules.get(phrase_lower, phrase_lower)
+    
+    def _chunk_document(self, doc: "spacy.tokens.Doc") -> Tuple[List[str], List[int]]:
+        """
+        Group a parsed transcript's sentences into chunks of up to DOC_CHUNK_TOKENS
+        
+        Returns:
+            (chunk_texts, chunk_token_counts)
+        """
+        chunks, sizes = [], []
+        current, current_size = [], 0
+        for sent in doc.sents:
+            if current and current_size + len(sent) > DOC_CHUNK_TOKENS:
+                chunks.append(" ".join(current))
+                sizes.append(current_size)
+                current, current_size = [], 0
+            current.append(sent.text)
+            current_size += len(sent)
+        
+        if current:
+            chunks.append(" ".join(current))
+            sizes.append(current_size)
+        return chunks, sizes
+    
+    def _encode_with_cache(self, doc: "spacy.tokens.Doc", candidates: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode a transcript and its candidate phrases, reusing cached phrase embeddings
+        
+        The transcript is split into sentence-aligned chunks so nothing past the
+        model's max sequence length is truncated; the document embedding is the
+        token-weighted mean of the chunk embeddings, re-normalized. The chunks
+        and any candidates missing from the phrase cache are encoded together
+        in a single call; the cache keeps the most recently
+        used PHRASE_EMB_CACHE_SIZE phrases, stored as float16 and returned
+        upcast to float32 for the similarity kernels.
+        
+        Returns:
+            (document_embedding, candidate_embeddings) with rows aligned to candidates
+        """
+        cache = self._phrase_emb_cache
+        with self._phrase_emb_lock:
+            found = {c: cache[c] for c in candidates if c in cache}
+            for phrase in found:
+                cache.move_to_end(phrase)
+        missing = [c for c in candidates if c not in found]
+        
+        chunks, chunk_sizes = self._chunk_document(doc)
+        
+        # Chunks and missing phrases are already one batch; spaCy work, MMR and
+        # file writes of other videos still overlap with it
+        with self._encode_lock:
+            embeddings = self.st_model.encode(
+                [*chunks, *missing],
+                batch_size=64,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            )
+        doc_embedding = np.average(embeddings[:len(chunks)], axis=0, weights=chunk_sizes)
+        doc_embedding = doc_embedding / np.linalg.norm(doc_embedding)
+        
+        # Cached as float16 to halve memory; fresh rows are rounded the same way
+        # so cold and warm runs select identical topics
+        found.update(zip(missing, embeddings[len(chunks):].astype(np.float16)))
+        candidate_embeddings = np.stack([found[c] for c in candidates]).astype(np.float32)
+        
+        with self._phrase_emb_lock:
+            for phrase in missing:
+                cache[phrase] = found[phrase]
+                cache.move_to_end(phrase)
+            while len(cache) > PHRASE_EMB_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        self.logger.debug(f"Phrase embedding cache: {len(candidates) - len(missing)}/{len(candidates)} hit")
+        return doc_embedding, candidate_embeddings
+    
+    def _load_phrase_embeddings(self, path: Path) -> Dict[str, np.ndarray]:
+        """
+        Seed the phrase embedding cache from an account's saved npz file
+        
+        Returns:
+            The saved phrase -> float16 embedding entries ({} if none usable)
+        """
+        if not path.exists():
+            return {}
+        
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["model"]) != self.model_name:
+                    self.logger.debug(f"Ignoring phrase embeddings for another model: {path}")
+                    return {}
+                phrases = data["phrases"].tolist()
+                embeddings = data["embeddings"].astype(np.float16)
+        except (OSError, KeyError, ValueError) as e:
+            self.logger.warning(f"Could not load phrase embeddings from {path}: {e}")
+            return {}
+        
+        cache = self._phrase_emb_cache
+        with self._phrase_emb_lock:
+            for phrase, embedding in zip(phrases, embeddings):
+                if phrase not in cache:
+                    cache[phrase] = embedding
+            while len(cache) > PHRASE_EMB_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        self.logger.debug(f"Loaded {len(phrases)} phrase embeddings from {path}")
+        return dict(zip(phrases, embeddings))
+    
+    def _save_phrase_embeddings(self, path: Path, phrases: Set[str], saved: Dict[str, np.ndarray]):
+        """
+        Save an account's phrase embeddings as a float16 npz file
         
-        return phrase_lower
+        Args:
+            path: npz file to replace
+            phrases: Phrases encoded in this run
+            saved: Entries already in the file, kept alongside the new ones
+        """
+        with self._phrase_emb_lock:
+            new = {p: self._phrase_emb_cache[p] for p in phrases
+                   if p not in saved and p in self._phrase_emb_cache}
+        if not new:
+            return
+        merged = {**saved, **new}
+        
+        # Write to a temp file and swap it in so readers never see a partial file
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                model=np.array(self.model_name),
+                phrases=np.array(list(merged)),
+                embeddings=np.stack(list(merged.values()))
+            )
+        os.replace(tmp_path, path)
+    
+    def _merge_near_duplicates(self,
+                               candidates: List[str],
+                               candidate_embeddings: np.ndarray,
+                               phrase_counts: Counter) -> Tuple[List[str], np.ndarray]:
+        """
+        Collapse near-duplicate candidates (e.g. "meditation" / "meditations")
+        
+        Two candidates merge when their embedding cosine and their edit distance
+        are both within canonical_map's auto_merge_threshold. Each merged group
+        keeps its most frequent phrase.
+        
+        Returns:
+            (candidates, candidate_embeddings) restricted to representatives
+        """
+        thresholds = self.canonical_map.get("auto_merge_threshold", {})
+        min_cosine = thresholds.get("cosine_similarity", 0.9)
+        max_edits = thresholds.get("edit_distance_max", 2)
+        
+        # Embeddings are normalized, so the Gram matrix holds pairwise cosines
+        similar = np.triu(candidate_embeddings @ candidate_embeddings.T > min_cosine, k=1)
+        pairs = np.argwhere(similar)
+        if not len(pairs):
+            return candidates, candidate_embeddings
+        
+        parent = list(range(len(candidates)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        for i, j in pairs:
+            if _edit_distance(candidates[i], candidates[j]) <= max_edits:
+                parent[find(i)] = find(j)
+        
+        # Representative of each group: most frequent phrase, first seen on ties
+        best = {}
+        for i, phrase in enumerate(candidates):
+            root = find(i)
+            if root not in best or phrase_counts[phrase] > phrase_counts[candidates[best[root]]]:
+                best[root] = i
+        
+        keep = sorted(best.values())
+        if len(keep) < len(candidates):
+            self.logger.debug(f"Merged {len(candidates) - len(keep)} near-duplicate candidates")
+        return [candidates[i] for i in keep], candidate_embeddings[keep]
     
     def _compute_mmr(self, 
                      candidates: List[str],
+                     candidate_embeddings: np.ndarray,
                      document_embedding: np.ndarray,
                      lambda_param: float = 0.7,
                      top_n: int = 10) -> List[Tuple[str, float]]:
@@ -186,6 +493,7 @@ class TopicExtractorV2:
         
         Args:
             candidates: List of candidate phrases
+            candidate_embeddings: Embeddings of the candidates (row per candidate)
             document_embedding: Embedding of full document
             lambda_param: Balance between relevance and diversity (0-1)
             top_n: Number of topics to select
@@ -196,46 +504,26 @@ class TopicExtractorV2:
         if not candidates:
             return []
         
-        # Encode all candidates
-        candidate_embeddings = self.st_model.encode(candidates)
+        n = len(candidates)
+        candidate_embeddings = np.ascontiguousarray(candidate_embeddings, dtype=np.float32)
+        document_embedding = np.ascontiguousarray(document_embedding, dtype=np.float32)
         
-        selected = []
-        selected_embeddings = []
-        remaining = list(range(len(candidates)))
+        # Embeddings are L2-normalized at encode time, so dot products are cosines
+        relevance = _dot_scores(candidate_embeddings, document_embedding)
         
-        while len(selected) < min(top_n, len(candidates)):
-            if not remaining:
-                break
-            
-            mmr_scores = []
-            for idx in remaining:
-                # Relevance: similarity to document
-                relevance = cosine_similarity(
-                    candidate_embeddings[idx].reshape(1, -1),
-                    document_embedding.reshape(1, -1)
-                )[0][0]
-                
-                # Redundancy: max similarity to already selected
-                if selected_embeddings:
-                    redundancy = max([
-                        cosine_similarity(
-                            candidate_embeddings[idx].reshape(1, -1),
-                            emb.reshape(1, -1)
-                        )[0][0]
-                        for emb in selected_embeddings
-                    ])
-                else:
-                    redundancy = 0
-                
-                # MMR score
-                mmr = lambda_param * relevance - (1 - lambda_param) * redundancy
-                mmr_scores.append((idx, mmr))
+        redundancy = np.full(n, -np.inf)
+        is_selected = np.zeros(n, dtype=bool)
+        
+        selected = []
+        for _ in range(min(top_n, n)):
+            # MMR score: λ * relevance - (1-λ) * max similarity to selected
+            mmr_scores = lambda_param * relevance - (1 - lambda_param) * np.maximum(redundancy, 0)
+            mmr_scores[is_selected] = -np.inf
             
-            # Select best MMR score
-            best_idx, best_score = max(mmr_scores, key=lambda x: x[1])
-            selected.append((candidates[best_idx], float(best_score)))
-            selected_embeddings.append(candidate_embeddings[best_idx])
-            remaining.remove(best_idx)
+            best_idx = int(np.argmax(mmr_scores))
+            selected.append((candidates[best_idx], float(mmr_scores[best_idx])))
+            is_selected[best_idx] = True
+            redundancy = np.maximum(redundancy, _dot_scores(candidate_embeddings, candidate_embeddings[best_idx]))
         
         return selected
     
@@ -247,7 +535,9 @@ class TopicExtractorV2:
                                      video_id: str = "",
                                      lambda_param: float = 0.7,
                                      max_topics: int = 10,
-                                     min_confidence: float = 0.0) -> List[EnhancedTopic]:
+                                     min_confidence: float = 0.0,
+                                     doc: Optional["spacy.tokens.Doc"] = None,
+                                     seen_phrases: Optional[Set[str]] = None) -> List[EnhancedTopic]:
         """
         Extract enhanced topics with evidence and timestamps
         
@@ -260,6 +550,8 @@ class TopicExtractorV2:
             lambda_param: MMR balance parameter (0-1)
             max_topics: Maximum topics to extract
             min_confidence: Minimum confidence threshold
+            doc: Transcript already parsed by self.nlp (parsed here if omitted)
+            seen_phrases: If given, collects the candidate phrases encoded for this video
             
         Returns:
             List of EnhancedTopic objects
@@ -272,23 +564,39 @@ class TopicExtractorV2:
         
         try:
             # Step 1: Extract noun phrase candidates
-            noun_phrases = self._extract_noun_phrases(transcript)
+            if doc is None:
+                doc = self.nlp(transcript)
+            noun_phrases = self._extract_noun_phrases(doc)
             
             # Step 2: Filter stop phrases
-            candidates = [phrase for phrase, _, _ in noun_phrases if not self._is_stop_phrase(phrase)]
-            candidates = list(set(candidates))  # Deduplicate
+            # Deduplicate first so each distinct phrase is checked once
+            phrase_counts = Counter(phrase for phrase, _, _ in noun_phrases)
+            candidates = [phrase for phrase in phrase_counts if not self._is_stop_phrase(phrase)]
             
             if not candidates:
                 self.logger.warning(f"No valid candidates for {video_id}")
                 return []
             
-            # Step 3: Encode document
-            doc_embedding = self.st_model.encode(transcript)
+            # Step 3: Encode document chunks and uncached candidates in one batch
+            doc_embedding, candidate_embeddings = self._encode_with_cache(doc, candidates)
+            if seen_phrases is not None:
+                seen_phrases.update(candidates)
+            candidates, candidate_embeddings = self._merge_near_duplicates(
+                candidates, candidate_embeddings, phrase_counts
+            )
             
             # Step 4: MMR selection
-            selected = self._compute_mmr(candidates, doc_embedding, lambda_param, max_topics * 2)
+            selected = self._compute_mmr(candidates, candidate_embeddings, doc_embedding, lambda_param, max_topics * 2)
             
             # Step 5: Build enhanced topics with evidence
+            starts, ends, texts = self._split_sentences(sentence_timestamps, transcript)
+            texts_lower = [text.lower() for text in texts]
+            evidence_by_phrase = self._find_all_evidence(
+                [phrase.lower() for phrase, _ in selected],
+                starts, ends, texts, texts_lower,
+                # Only the transcript fallback caps evidence collection
+                limit=None if sentence_timestamps else 5
+            )
             enhanced_topics = []
             for phrase, mmr_score in selected:
                 # Skip very low MMR scores (these are likely noise)
@@ -296,7 +604,7 @@ class TopicExtractorV2:
                     continue
                 
                 # Find evidence in transcript
-                evidence = self._find_evidence(phrase, sentence_timestamps, transcript)
+                evidence = evidence_by_phrase[phrase.lower()]
                 # Note: Evidence is optional - topics can exist without sentence-level evidence
                 
                 # Canonicalize
@@ -343,38 +651,62 @@ class TopicExtractorV2:
             self.logger.error(f"Error extracting topics for {video_id}: {e}", exc_info=True)
             return []
     
-    def _find_evidence(self, phrase: str, sentence_timestamps: List[Dict[str, Any]], full_transcript: str = "") -> List[TopicEvidence]:
-        """Find sentences containing the phrase"""
-        evidence = []
-        phrase_lower = phrase.lower()
+    def _split_sentences(self,
+                         sentence_timestamps: List[Dict[str, Any]],
+                         full_transcript: str = "") -> Tuple[List[float], List[float], List[str]]:
+        """
+        Resolve sentences once into parallel (starts, ends, texts) lists
         
-        # Try with sentence_timestamps first if available
+        Uses sentence_timestamps when available, otherwise splits the full
+        transcript on periods with unknown (0.0) timestamps.
+        """
         if sentence_timestamps:
-            for idx, sent in enumerate(sentence_timestamps):
-                text = sent.get("text", sent.get("sentence", ""))
-                if phrase_lower in text.lower():
-                    ev = TopicEvidence(
-                        sentence_index=idx,
-                        start_time=sent.get("start_time", 0),
-                        end_time=sent.get("end_time", 0),
-                        text=text[:150]  # Truncate for storage
-                    )
-                    evidence.append(ev)
-        
-        # Fallback: search full transcript if no timestamps available
-        elif full_transcript:
-            sentences = [s.strip() for s in full_transcript.split('.') if s.strip()]
-            for idx, sent in enumerate(sentences):
-                if phrase_lower in sent.lower():
-                    ev = TopicEvidence(
-                        sentence_index=idx,
-                        start_time=0.0,  # Unknown timestamp
-                        end_time=0.0,
-                        text=sent[:150]
-                    )
-                    evidence.append(ev)
-                    if len(evidence) >= 5:  # Limit evidence collection
-                        break
+            starts = [sent.get("start_time", 0) for sent in sentence_timestamps]
+            ends = [sent.get("end_time", 0) for sent in sentence_timestamps]
+            texts = [sent.get("text", sent.get("sentence", "")) for sent in sentence_timestamps]
+            return starts, ends, texts
+        
+        texts = [s.strip() for s in full_transcript.split('.') if s.strip()]
+        return [0.0] * len(texts), [0.0] * len(texts), texts
+    
+    def _find_all_evidence(self,
+                           phrases_lower: List[str],
+                           starts: List[float],
+                           ends: List[float],
+                           texts: List[str],
+                           texts_lower: List[str],
+                           limit: Optional[int] = None) -> Dict[str, List[TopicEvidence]]:
+        """
+        Find sentences containing each phrase in a single pass over the sentences
+        
+        Each phrase is tested as a substring of the pre-lowercased sentence, so
+        overlapping phrases ("lucid" and "lucid dream") and phrases with
+        non-word characters ("c++", "#fyp") all match.
+        
+        Args:
+            phrases_lower: Lowercased phrases to look for
+            starts, ends, texts, texts_lower: Parallel per-sentence lists
+            limit: Max evidence sentences per phrase (None for no limit)
+        
+        Returns:
+            Dict mapping lowercased phrase to its evidence list
+        """
+        evidence = {phrase: [] for phrase in phrases_lower}
+        if not evidence:
+            return evidence
+        
+        for idx, text_lower in enumerate(texts_lower):
+            for phrase, hits in evidence.items():
+                if phrase not in text_lower:
+                    continue
+                if limit is not None and len(hits) >= limit:
+                    continue
+                hits.append(TopicEvidence(
+                    sentence_index=idx,
+                    start_time=starts[idx],
+                    end_time=ends[idx],
+                    text=texts[idx][:150]  # Truncate for storage
+                ))
         
         return evidence
     
@@ -444,8 +776,7 @@ class TopicExtractorV2:
         if not index_file.exists():
             raise FileNotFoundError(f"Index not found: {index_file}")
         
-        with open(index_file, 'r') as f:
-            index = json.load(f)
+        index = _read_json(index_file)
         
         processed_videos = index.get('processed_videos', {})
         topics_dir = account_dir / "topics"
@@ -462,6 +793,8 @@ class TopicExtractorV2:
         
         self.logger.info(f"Extracting V2 topics for {len(processed_videos)} videos in @{username}...")
         
+        # Load transcripts first so spaCy can parse them in one batched pipe
+        pending = []
         for video_id, video_data in processed_videos.items():
             if not video_data.get('success'):
                 results['skipped'] += 1
@@ -494,62 +827,108 @@ class TopicExtractorV2:
                 timestamp_file = transcriptions_dir / f"{video_id}_timestamps.json"
                 timestamps = []
                 if timestamp_file.exists():
-                    with open(timestamp_file, 'r') as f:
-                        timestamps = json.load(f)
-                
-                # Extract V2 topics
-                title = video_data.get('title', '')
-                hashtags = video_data.get('hashtags', [])
-                
-                topics = self.extract_video_topics_enhanced(
-                    transcript_text,
-                    timestamps,
-                    title=title,
-                    hashtags=hashtags
-                )
-                
-                # Save V2 tags
-                v2_data = {
-                    "video_id": video_id,
-                    "username": username,
-                    "title": title,
-                    "total_topics": len(topics),
-                    "topics": [
-                        {
-                            "tag": t.tag,
-                            "canonical": t.canonical,
-                            "confidence": t.confidence,
-                            "score": t.score,
-                            "type": t.type,
-                            "source": t.source,
-                            "evidence": [
-                                {
-                                    "sentence_index": ev.sentence_index,
-                                    "start": ev.start_time,
-                                    "end": ev.end_time,
-                                    "text": ev.text
-                                }
-                                for ev in t.evidence
-                            ],
-                            "stats": t.stats
-                        }
-                        for t in topics
-                    ]
-                }
-                
-                with open(v2_tag_file, 'w') as f:
-                    json.dump(v2_data, f, indent=2)
-                
-                results['extracted'] += 1
-                self.logger.debug(f"Extracted {len(topics)} V2 topics for {video_id}")
-                
+                    timestamps = _read_json(timestamp_file)
             except Exception as e:
-                self.logger.error(f"Failed to extract V2 topics for {video_id}: {e}")
+                self.logger.error(f"Failed to load transcript for {video_id}: {e}")
                 results['failed'] += 1
+                continue
+            
+            pending.append((video_id, video_data, v2_tag_file, transcript_text, timestamps))
+        
+        # Reuse phrase embeddings saved by earlier runs on this account
+        phrase_emb_file = topics_dir / "phrase_embeddings.npz"
+        saved_embeddings = self._load_phrase_embeddings(phrase_emb_file) if pending else {}
+        seen_phrases = set()
+        
+        # Parsing stays on this thread; embedding, MMR and writes overlap on the pool
+        docs = self.nlp.pipe((p[3] for p in pending), batch_size=32)
+        with ThreadPoolExecutor(max_workers=V2_WORKERS) as executor:
+            futures = [
+                (item[0], executor.submit(self._extract_and_save_video, username, *item, doc, seen_phrases))
+                for item, doc in zip(pending, docs)
+            ]
+            
+            for video_id, future in futures:
+                try:
+                    num_topics = future.result()
+                    
+                    results['extracted'] += 1
+                    self.logger.debug(f"Extracted {num_topics} V2 topics for {video_id}")
+                    
+                except Exception as e:
+                    self.logger.error(f"Failed to extract V2 topics for {video_id}: {e}")
+                    results['failed'] += 1
+        
+        if seen_phrases:
+            try:
+                self._save_phrase_embeddings(phrase_emb_file, seen_phrases, saved_embeddings)
+            except OSError as e:
+                self.logger.warning(f"Could not save phrase embeddings to {phrase_emb_file}: {e}")
         
         self.logger.info(f"V2 extraction complete: {results['extracted']} extracted, {results['skipped']} skipped, {results['failed']} failed")
         return results
 
+    
+    def _extract_and_save_video(self,
+                                username: str,
+                                video_id: str,
+                                video_data: Dict[str, Any],
+                                v2_tag_file: Path,
+                                transcript_text: str,
+                                timestamps: List[Dict[str, Any]],
+                                doc: "spacy.tokens.Doc",
+                                seen_phrases: Optional[Set[str]] = None) -> int:
+        """
+        Extract V2 topics for one parsed transcript and write its tags file
+        
+        Returns:
+            Number of topics saved
+        """
+        # Extract V2 topics
+        title = video_data.get('title', '')
+        hashtags = video_data.get('hashtags', [])
+        
+        topics = self.extract_video_topics_enhanced(
+            transcript_text,
+            timestamps,
+            title=title,
+            hashtags=hashtags,
+            doc=doc,
+            seen_phrases=seen_phrases
+        )
+        
+        # Save V2 tags
+        v2_data = {
+            "video_id": video_id,
+            "username": username,
+            "title": title,
+            "total_topics": len(topics),
+            "topics": [
+                {
+                    "tag": t.tag,
+                    "canonical": t.canonical,
+                    "confidence": t.confidence,
+                    "score": t.score,
+                    "type": t.type,
+                    "source": t.source,
+                    "evidence": [
+                        {
+                            "sentence_index": ev.sentence_index,
+                            "start": ev.start_time,
+                            "end": ev.end_time,
+                            "text": ev.text
+                        }
+                        for ev in t.evidence
+                    ],
+                    "stats": t.stats
+                }
+                for t in topics
+            ]
+        }
+        
+        _write_json(v2_tag_file, v2_data)
+        return len(topics)
+
 
 def main():
     """CLI for testing"""
@@ -15,15 +15,19 @@ Usage:
     python umbrella_builder.py visualize --account kwrt_
 """
 
+import os
 import json
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Set
+from typing import Any, List, Dict, Tuple, Set
 from dataclasses import dataclass, asdict
-from collections import defaultdict, Counter
+from collections import defaultdict
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 from scipy.sparse import csr_matrix
 from scipy.sparse.csgraph import connected_components
 import warnings
@@ -34,16 +38,28 @@ logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 # Try importing graph clustering libraries
+IGRAPH_AVAILABLE = False
 LEIDEN_AVAILABLE = False
 LOUVAIN_AVAILABLE = False
 HDBSCAN_AVAILABLE = False
 
 try:
     import igraph as ig
+    IGRAPH_AVAILABLE = True
+except ImportError:
+    pass
+
+try:
     import leidenalg
-    LEIDEN_AVAILABLE = True
-    logger.info("✓ Leiden algorithm available")
+    LEIDEN_AVAILABLE = IGRAPH_AVAILABLE
 except ImportError:
+    pass
+
+if LEIDEN_AVAILABLE:
+    logger.info("✓ Leiden algorithm available")
+elif IGRAPH_AVAILABLE:
+    logger.info("✓ igraph Louvain (multilevel) available")
+else:
     logger.warning("⚠ leidenalg not available, trying louvain...")
 
 try:
@@ -61,13 +77,258 @@ try:
 except ImportError:
     logger.warning("⚠ HDBSCAN not available")
 
-if not (LEIDEN_AVAILABLE or LOUVAIN_AVAILABLE or HDBSCAN_AVAILABLE):
+# Optional SIMD int8 kernels for the similarity threshold pass
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+# Optional faster JSON (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional JIT for umbrella label word counting
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if not (IGRAPH_AVAILABLE or LOUVAIN_AVAILABLE or HDBSCAN_AVAILABLE):
     logger.error("❌ No clustering library available! Install one of:")
     logger.error("   pip install leidenalg python-igraph")
     logger.error("   pip install python-louvain networkx")
     logger.error("   pip install hdbscan")
 
 
+def _user_cache_dir() -> Path:
+    """Per-user cache for model artifacts (HERMES_CACHE_DIR, default ~/.cache/hermes)"""
+    return Path(os.getenv('HERMES_CACHE_DIR') or Path.home() / '.cache' / 'hermes')
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any):
+    """Write an indented JSON file, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+# Sentence transformer backend for topic embeddings: onnx, openvino or torch
+UMBRELLA_BACKEND = os.getenv('UMBRELLA_BACKEND', 'onnx')
+
+# Pre-quantized int8 weights published alongside sentence-transformers hub models
+INT8_MODEL_FILES = {
+    "onnx": "onnx/model_qint8_avx512_vnni.onnx",
+    "openvino": "openvino/openvino_model_qint8_quantized.xml",
+}
+
+# Loaded sentence transformers keyed by (model name, backend), shared by every
+# UmbrellaBuilder in the process so the model is only loaded once
+_MODEL_CACHE: Dict[Tuple[str, str], SentenceTransformer] = {}
+
+
+def _load_model(model_name: str, backend: str) -> SentenceTransformer:
+    """
+    Load the sentence transformer, preferring int8 weights on onnx/openvino
+    
+    Falls back to the backend's default (fp32) export, then to torch, when
+    the quantized file or the backend's runtime is not available.
+    """
+    if backend != "torch":
+        int8_file = INT8_MODEL_FILES.get(backend)
+        attempts = [{"file_name": int8_file}, None] if int8_file else [None]
+        if int8_file is None:
+            logger.warning(f"Unknown backend {backend!r}, no int8 weights to try")
+        for model_kwargs in attempts:
+            try:
+                return SentenceTransformer(model_name, backend=backend, model_kwargs=model_kwargs)
+            except Exception as e:
+                logger.debug(f"{backend} backend ({model_kwargs}) unavailable: {e}")
+        logger.warning(f"{backend} backend unavailable for {model_name}, using torch")
+    
+    torch.set_num_threads(int(os.getenv('TOPIC_THREADS', min(8, os.cpu_count() or 4))))
+    return SentenceTransformer(model_name)
+
+
+def _get_model(model_name: str, backend: str = UMBRELLA_BACKEND) -> SentenceTransformer:
+    """Get the process-wide sentence transformer for a model, loading it on first use"""
+    model = _MODEL_CACHE.get((model_name, backend))
+    if model is None:
+        model = _MODEL_CACHE.setdefault((model_name, backend), _load_model(model_name, backend))
+    return model
+
+
+class EmbeddingCache:
+    """
+    Persistent topic embedding cache in front of a SentenceTransformer
+    
+    Embeddings are keyed by sha1 of the topic text and stored in one npz file
+    per model under the user cache (HERMES_CACHE_DIR/umbrella_embeddings/),
+    so topics shared across accounts and runs are only encoded once.
+    """
+    
+    def __init__(self, model: SentenceTransformer, model_name: str,
+                 cache_dir: Path = None):
+        self.model = model
+        cache_dir = cache_dir or _user_cache_dir() / 'umbrella_embeddings'
+        self.path = cache_dir / f"{model_name.replace('/', '_')}.npz"
+        self._embeddings = None  # sha1 -> normalized embedding, loaded on first use
+        self._lock = threading.Lock()
+        
+    def _load(self) -> Dict[str, np.ndarray]:
+        """Load cached embeddings from disk"""
+        if not self.path.exists():
+            return {}
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                return dict(zip(data['keys'].tolist(), data['embeddings']))
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable embedding cache {self.path}: {e}")
+            return {}
+            
+    def _save(self):
+        """Write cached embeddings to disk, replacing the file atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                keys=np.array(list(self._embeddings.keys())),
+                embeddings=np.stack(list(self._embeddings.values()))
+            )
+        os.replace(tmp_path, self.path)
+        
+    def _encode_length_sorted(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Encode texts in batches of similar token length to minimize padding
+        
+        Returns:
+            Normalized embeddings in the original text order
+        """
+        lengths = self.model.tokenizer(
+            texts,
+            truncation=True,
+            max_length=self.model.max_seq_length,
+            return_length=True
+        )['length']
+        order = np.argsort(lengths, kind='stable')
+        
+        # One encode() call per batch: encode() re-sorts whatever it is given
+        # by character length, which would undo the token-length bucketing
+        sorted_embeddings = np.vstack([
+            self.model.encode(
+                [texts[i] for i in order[start:start + batch_size]],
+                batch_size=batch_size,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+            for start in range(0, len(texts), batch_size)
+        ])
+        
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+        
+    def encode(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Normalized embeddings for texts, encoding only those not cached
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Encoder batch size for cache misses
+            
+        Returns:
+            Embedding matrix aligned with texts
+        """
+        keys = [hashlib.sha1(text.encode('utf-8')).hexdigest() for text in texts]
+        with self._lock:
+            if self._embeddings is None:
+                self._embeddings = self._load()
+            found = {key: self._embeddings[key] for key in keys if key in self._embeddings}
+        misses = {key: text for key, text in zip(keys, texts) if key not in found}
+        
+        if misses:
+            # Encode outside the lock so concurrent accounts overlap inference
+            found.update(zip(misses.keys(), self._encode_length_sorted(list(misses.values()), batch_size)))
+            with self._lock:
+                self._embeddings.update((key, found[key]) for key in misses)
+                try:
+                    self._save()
+                except OSError as e:
+                    logger.warning(f"Could not save embedding cache {self.path}: {e}")
+                
+        logger.info(f"Embedding cache: {len(texts) - len(misses)}/{len(texts)} topics hit")
+        return np.stack([found[key] for key in keys])
+
+
+# Accounts built concurrently by build_all_accounts
+UMBRELLA_WORKERS = int(os.getenv('UMBRELLA_WORKERS', min(8, os.cpu_count() or 1)))
+
+# Words never used in umbrella labels
+LABEL_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'from', 'by', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that',
+    'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'my', 'your', 'his', 'her', 'its', 'our', 'their', 'me', 'him',
+    'just', 'like', 'really', 'very', 'too', 'so', 'such', 'make',
+    'get', 'got', 'going', 'go', 'thing', 'things', 'people', 'person',
+    'video', 'videos', 'watching', 'watch', 'thank', 'thanks',
+})
+
+# Punctuation stripped from the ends of label words
+LABEL_PUNCTUATION = '.,!?;:()[]{}"\'-#'
+
+# account_tags.json fields used to build umbrellas; the rest is dropped on load
+TAG_FIELDS = ('tag', 'canonical', 'frequency', 'avg_score', 'video_ids')
+
+# Rows per block when thresholding pairwise topic similarities
+SIMILARITY_BLOCK_ROWS = 512
+
+
+if HAS_NUMBA:
+    @njit(cache=True, nogil=True)
+    def _count_label_words(tokens: np.ndarray, offsets: np.ndarray, n_vocab: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Occurrences and topic coverage per word id (topic t is tokens[offsets[t]:offsets[t + 1]])"""
+        counts = np.zeros(n_vocab, dtype=np.int64)
+        coverage = np.zeros(n_vocab, dtype=np.int64)
+        last_topic = np.full(n_vocab, -1, dtype=np.int64)
+        for t in range(offsets.shape[0] - 1):
+            for i in range(offsets[t], offsets[t + 1]):
+                word = tokens[i]
+                counts[word] += 1
+                if last_topic[word] != t:
+                    last_topic[word] = t
+                    coverage[word] += 1
+        return counts, coverage
+else:
+    def _count_label_words(tokens: np.ndarray, offsets: np.ndarray, n_vocab: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Occurrences and topic coverage per word id (topic t is tokens[offsets[t]:offsets[t + 1]])"""
+        counts = np.bincount(tokens, minlength=n_vocab)
+        coverage = np.zeros(n_vocab, dtype=np.int64)
+        for t in range(len(offsets) - 1):
+            coverage[np.unique(tokens[offsets[t]:offsets[t + 1]])] += 1
+        return counts, coverage
+
+
 @dataclass
 class TopicNode:
     """Represents a single topic in the graph"""
@@ -112,16 +373,23 @@ class UmbrellaBuilder:
         
         # Load sentence transformer for embeddings
         logger.info("Loading sentence transformer model...")
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        model_name = 'all-MiniLM-L6-v2'
+        self.model = _get_model(model_name)
+        # int8 and fp32 embeddings differ slightly, so each backend has its own cache
+        self.embedding_cache = EmbeddingCache(self.model, f"{model_name}-{UMBRELLA_BACKEND}")
         logger.info("Model loaded successfully")
         
-    def build_account_umbrellas(self, username: str, max_umbrellas: int = 5) -> Dict:
+        self.canonical_rules = self._load_canonical_rules()
+        
+    def build_account_umbrellas(self, username: str, max_umbrellas: int = 5,
+                                embedding_map: Dict[str, np.ndarray] = None) -> Dict:
         """
         Build umbrellas for a single account
         
         Args:
             username: TikTok username
             max_umbrellas: Maximum number of umbrellas to return (default: 5)
+            embedding_map: Precomputed canonical topic -> embedding (skips encoding)
             
         Returns:
             Dictionary with umbrella data
@@ -136,10 +404,7 @@ class UmbrellaBuilder:
             logger.error(f"Account tags not found: {account_path}")
             return None
             
-        with open(account_path) as f:
-            account_data = json.load(f)
-            
-        tags = account_data.get('tags', [])
+        tags = self._load_account_tags(account_path)
         if len(tags) < self.min_cluster_size:
             logger.warning(f"Too few tags ({len(tags)}) to build umbrellas")
             return None
@@ -147,26 +412,30 @@ class UmbrellaBuilder:
         logger.info(f"Loaded {len(tags)} tags")
         
         # Extract canonical topics with metadata
-        # Load canonical mapping if exists
-        canonical_config_path = Path("config/canonical_topics.json")
-        canonical_rules = {}
-        if canonical_config_path.exists():
-            with open(canonical_config_path) as f:
-                config = json.load(f)
-                canonical_rules = config.get('merge_rules', {})
+        canonical_rules = self.canonical_rules
+        
+        # Skip the rebuild when inputs and settings match the saved umbrellas
+        output_path = Path(f"accounts/{username}/topics/topic_umbrellas.json")
+        input_hash = hashlib.blake2b(json.dumps({
+            'tags': tags,
+            'canonical_rules': canonical_rules,
+            'resolution': self.resolution,
+            'min_cluster_size': self.min_cluster_size,
+            'max_umbrellas': max_umbrellas,
+        }, sort_keys=True).encode('utf-8')).hexdigest()
+        existing = self._load_existing_umbrellas(output_path)
+        if (existing.get('input_hash') == input_hash
+                and existing.get('similarity_threshold') == self.similarity_threshold
+                and existing.get('clustering_method') == self._get_clustering_method()):
+            logger.info(f"✓ Tags unchanged, reusing {output_path}")
+            return existing
         
         topic_nodes = []
         canonical_map = {}  # canonical -> list of original tags
         
         for tag_data in tags:
             tag = tag_data['tag']
-            
-            # Get canonical form (from V2 data or apply rules)
-            if 'canonical' in tag_data:
-                canonical = tag_data['canonical']
-            else:
-                # Apply canonical rules for V1 data
-                canonical = canonical_rules.get(tag.lower(), tag)
+            canonical = self._canonical_topic(tag_data, canonical_rules)
             
             if canonical not in canonical_map:
                 canonical_map[canonical] = []
@@ -185,8 +454,11 @@ class UmbrellaBuilder:
         
         # Compute embeddings for canonical topics
         canonical_topics = list(canonical_map.keys())
-        logger.info("Computing embeddings...")
-        embeddings = self.model.encode(canonical_topics, show_progress_bar=False)
+        if embedding_map is not None and all(topic in embedding_map for topic in canonical_topics):
+            embeddings = np.stack([embedding_map[topic] for topic in canonical_topics])
+        else:
+            logger.info("Computing embeddings...")
+            embeddings = self.embedding_cache.encode(canonical_topics)
         
         # Store embeddings in nodes
         embedding_map = {topic: emb for topic, emb in zip(canonical_topics, embeddings)}
@@ -234,19 +506,14 @@ class UmbrellaBuilder:
             'total_clusters': len(umbrellas),  # Keep track of total clusters found
             'clustering_method': self._get_clustering_method(),
             'similarity_threshold': self.similarity_threshold,
-            'umbrellas': [asdict(u) for u in top_umbrellas]
+            'input_hash': input_hash,
+            # Sets become sorted lists for JSON serialization
+            'umbrellas': [{**asdict(u), 'video_ids': sorted(u.video_ids)} for u in top_umbrellas]
         }
-        
-        # Convert sets to lists for JSON serialization
-        for umbrella in output['umbrellas']:
-            umbrella['video_ids'] = sorted(list(umbrella['video_ids']))
             
         # Save to file
-        output_path = Path(f"accounts/{username}/topics/topic_umbrellas.json")
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w') as f:
-            json.dump(output, f, indent=2)
+        _write_json(output_path, output)
             
         logger.info(f"✓ Saved umbrellas to {output_path}")
         
@@ -255,11 +522,77 @@ class UmbrellaBuilder:
         
         return output
         
+    def _load_canonical_rules(self) -> Dict[str, str]:
+        """Merge rules from config/canonical_topics.json, or {} if missing"""
+        canonical_config_path = Path("config/canonical_topics.json")
+        if not canonical_config_path.exists():
+            return {}
+        with open(canonical_config_path) as f:
+            return json.load(f).get('merge_rules', {})
+            
+    @staticmethod
+    def _load_account_tags(account_path: Path) -> List[Dict]:
+        """Tags from account_tags.json, keeping only TAG_FIELDS of each"""
+        tags = _read_json(account_path).get('tags', [])
+        return [{key: tag_data[key] for key in TAG_FIELDS if key in tag_data} for tag_data in tags]
+        
+    @staticmethod
+    def _canonical_topic(tag_data: Dict, canonical_rules: Dict[str, str]) -> str:
+        """Canonical form of a tag (from V2 data, or V1 tags via merge rules)"""
+        if 'canonical' in tag_data:
+            return tag_data['canonical']
+        tag = tag_data['tag']
+        return canonical_rules.get(tag.lower(), tag)
+        
+    def _encode_all_canonical_topics(self, accounts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Embed the union of canonical topics across accounts in one pass
+        
+        Larger batches over the whole corpus keep the encoder busier than
+        many small per-account calls.
+        
+        Returns:
+            Canonical topic -> normalized embedding
+        """
+        union = {}
+        for username in accounts:
+            account_path = Path(f"accounts/{username}/topics/account_tags.json")
+            try:
+                tags = self._load_account_tags(account_path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read {account_path}: {e}")
+                continue
+            for tag_data in tags:
+                union[self._canonical_topic(tag_data, self.canonical_rules)] = None
+                
+        topics = list(union)
+        if not topics:
+            return {}
+        logger.info(f"Computing embeddings for {len(topics)} canonical topics across {len(accounts)} accounts...")
+        embeddings = self.embedding_cache.encode(topics, batch_size=256)
+        return dict(zip(topics, embeddings))
+        
+    def _load_existing_umbrellas(self, output_path: Path) -> Dict:
+        """Previously saved umbrellas, or {} if missing or unreadable"""
+        if not output_path.exists():
+            return {}
+        try:
+            return _read_json(output_path)
+        except (OSError, ValueError):
+            return {}
+            
     def _build_similarity_graph(self, 
                                  topics: List[str], 
-                                 embeddings: np.ndarray) -> Tuple[np.ndarray, int]:
+                                 embeddings: np.ndarray) -> Tuple[csr_matrix, int]:
         """
-        Build adjacency matrix from topic embeddings
+        Build a sparse adjacency matrix from topic embeddings
+        
+        Each undirected edge is stored once, in the upper triangle, with the
+        pair's cosine similarity as its value. Similarities are computed in
+        blocks of SIMILARITY_BLOCK_ROWS rows against the remaining columns, so
+        peak memory is O(block * N) rather than a full N x N matrix. With
+        simsimd installed, the threshold pass runs on int8-quantized embeddings
+        (cosine is scale-invariant, so one global scale suffices).
         
         Args:
             topics: List of topic strings
@@ -268,32 +601,59 @@ class UmbrellaBuilder:
         Returns:
             (adjacency_matrix, edge_count)
         """
-        # Compute pairwise cosine similarities
-        sim_matrix = cosine_similarity(embeddings)
+        n = len(embeddings)
+        all_rows, all_cols, all_sims = [], [], []
         
-        # Threshold and remove self-loops
-        adj_matrix = (sim_matrix >= self.similarity_threshold).astype(int)
-        np.fill_diagonal(adj_matrix, 0)
+        if HAS_SIMSIMD:
+            scale = 127 / max(float(np.abs(embeddings).max()), 1e-12)
+            quantized = np.round(embeddings * scale).astype(np.int8)
+        
+        for start in range(0, n, SIMILARITY_BLOCK_ROWS):
+            stop = min(start + SIMILARITY_BLOCK_ROWS, n)
+            
+            # Cosine similarities of this row block against columns from
+            # `start` on (embeddings are L2-normalized)
+            if HAS_SIMSIMD:
+                block = 1 - np.asarray(simsimd.cdist(
+                    quantized[start:stop],
+                    quantized[start:],
+                    metric='cosine'
+                ))
+            else:
+                block = embeddings[start:stop] @ embeddings[start:].T
+            
+            # Threshold on a bool mask, keeping the upper triangle only
+            # (no self-loops, one entry per edge) without a triu copy
+            rows, cols = np.nonzero(block >= self.similarity_threshold)
+            upper = cols > rows
+            rows, cols = rows[upper], cols[upper]
+            all_rows.append(rows + start)
+            all_cols.append(cols + start)
+            all_sims.append(block[rows, cols])
         
-        edge_count = np.sum(adj_matrix) // 2  # Divide by 2 for undirected
+        rows = np.concatenate(all_rows)
+        cols = np.concatenate(all_cols)
+        adj_matrix = csr_matrix((np.concatenate(all_sims), (rows, cols)), shape=(n, n))
         
-        return adj_matrix, edge_count
+        return adj_matrix, len(rows)
         
     def _cluster_topics(self, 
                         topics: List[str], 
-                        adj_matrix: np.ndarray) -> List[List[int]]:
+                        adj_matrix: csr_matrix) -> List[List[int]]:
         """
         Apply community detection algorithm
         
         Args:
             topics: List of topic strings
-            adj_matrix: Adjacency matrix
+            adj_matrix: Upper-triangular sparse adjacency matrix
             
         Returns:
             List of clusters (each cluster is list of topic indices)
         """
         if LEIDEN_AVAILABLE:
             return self._cluster_leiden(adj_matrix)
+        elif IGRAPH_AVAILABLE:
+            return self._cluster_igraph_louvain(adj_matrix)
         elif LOUVAIN_AVAILABLE:
             return self._cluster_louvain(adj_matrix)
         elif HDBSCAN_AVAILABLE:
@@ -303,38 +663,73 @@ class UmbrellaBuilder:
             logger.warning("Using basic connected components (no optimization)")
             return self._cluster_connected_components(adj_matrix)
             
-    def _cluster_leiden(self, adj_matrix: np.ndarray) -> List[List[int]]:
-        """Leiden algorithm clustering"""
-        # Convert to igraph
-        sources, targets = np.where(np.triu(adj_matrix, k=1))
-        edges = list(zip(sources.tolist(), targets.tolist()))
+    def _group_by_label(self, labels, min_size: int) -> List[List[int]]:
+        """
+        Group node indices by cluster label
+        
+        Negative labels (noise) are dropped. Groups are returned in order of
+        each label's first node, with indices ascending within a group.
+        """
+        labels = np.asarray(labels)
+        if labels.size == 0:
+            return []
+        order = np.argsort(labels, kind='stable')
+        sorted_labels = labels[order]
+        boundaries = np.flatnonzero(np.diff(sorted_labels)) + 1
         
-        g = ig.Graph()
-        g.add_vertices(adj_matrix.shape[0])
-        g.add_edges(edges)
+        groups = [
+            group for group, start in zip(np.split(order, boundaries), np.r_[0, boundaries])
+            if sorted_labels[start] >= 0 and len(group) >= min_size
+        ]
+        groups.sort(key=lambda group: group[0])
+        return [group.tolist() for group in groups]
+        
+    def _to_igraph(self, adj_matrix: csr_matrix) -> "ig.Graph":
+        """Weighted igraph graph from the upper-triangular adjacency"""
+        edges = adj_matrix.tocoo()
+        return ig.Graph(
+            n=adj_matrix.shape[0],
+            edges=list(zip(edges.row.tolist(), edges.col.tolist())),
+            edge_attrs={'weight': edges.data.tolist()}
+        )
+        
+    def _cluster_leiden(self, adj_matrix: csr_matrix) -> List[List[int]]:
+        """Leiden algorithm clustering"""
+        g = self._to_igraph(adj_matrix)
         
-        # Run Leiden
+        # Run Leiden on weighted modularity (RBConfiguration is modularity
+        # with a resolution parameter; 1.0 gives standard modularity)
         partition = leidenalg.find_partition(
             g, 
-            leidenalg.ModularityVertexPartition,
+            leidenalg.RBConfigurationVertexPartition,
+            weights='weight',
             resolution_parameter=self.resolution
         )
         
-        # Group by community
-        clusters = defaultdict(list)
-        for node_id, community_id in enumerate(partition.membership):
-            clusters[community_id].append(node_id)
-            
-        # Filter by min size
-        clusters = [c for c in clusters.values() if len(c) >= self.min_cluster_size]
+        # Group by community, filtering by min size
+        clusters = self._group_by_label(partition.membership, self.min_cluster_size)
         
         logger.info(f"Leiden found {len(clusters)} clusters")
         return clusters
         
-    def _cluster_louvain(self, adj_matrix: np.ndarray) -> List[List[int]]:
+    def _cluster_igraph_louvain(self, adj_matrix: csr_matrix) -> List[List[int]]:
+        """Louvain (multilevel) clustering with igraph's C implementation"""
+        g = self._to_igraph(adj_matrix)
+        partition = g.community_multilevel(weights='weight', resolution=self.resolution)
+        
+        # Group by community, filtering by min size
+        clusters = self._group_by_label(partition.membership, self.min_cluster_size)
+        
+        logger.info(f"igraph Louvain found {len(clusters)} clusters")
+        return clusters
+        
+    def _cluster_louvain(self, adj_matrix: csr_matrix) -> List[List[int]]:
         """Louvain algorithm clustering"""
-        # Convert to networkx
-        G = nx.from_numpy_array(adj_matrix)
+        # Convert to networkx (unweighted edges, as community detection expects)
+        edges = adj_matrix.tocoo()
+        G = nx.Graph()
+        G.add_nodes_from(range(adj_matrix.shape[0]))
+        G.add_edges_from(zip(edges.row.tolist(), edges.col.tolist()))
         
         # Run Louvain
         partition = community_louvain.best_partition(
@@ -343,21 +738,20 @@ class UmbrellaBuilder:
             random_state=42
         )
         
-        # Group by community
-        clusters = defaultdict(list)
-        for node_id, community_id in partition.items():
-            clusters[community_id].append(node_id)
-            
-        # Filter by min size
-        clusters = [c for c in clusters.values() if len(c) >= self.min_cluster_size]
+        # Group by community, filtering by min size
+        clusters = self._group_by_label(
+            [partition[node_id] for node_id in range(adj_matrix.shape[0])],
+            self.min_cluster_size
+        )
         
         logger.info(f"Louvain found {len(clusters)} clusters")
         return clusters
         
-    def _cluster_hdbscan(self, topics: List[str], adj_matrix: np.ndarray) -> List[List[int]]:
+    def _cluster_hdbscan(self, topics: List[str], adj_matrix: csr_matrix) -> List[List[int]]:
         """HDBSCAN clustering (fallback)"""
-        # Convert adjacency to distance
-        distance_matrix = 1 - (adj_matrix.astype(float) / adj_matrix.max())
+        # Convert adjacency to distance (precomputed metric needs a dense matrix)
+        connected = (adj_matrix + adj_matrix.T).toarray() > 0
+        distance_matrix = 1 - (connected.astype(float) / connected.max())
         
         clusterer = hdbscan.HDBSCAN(
             min_cluster_size=self.min_cluster_size,
@@ -367,29 +761,18 @@ class UmbrellaBuilder:
         
         labels = clusterer.fit_predict(distance_matrix)
         
-        # Group by label (ignore noise points with label=-1)
-        clusters = defaultdict(list)
-        for idx, label in enumerate(labels):
-            if label >= 0:
-                clusters[label].append(idx)
-                
-        clusters = list(clusters.values())
+        # Group by label (noise points with label=-1 are dropped)
+        clusters = self._group_by_label(labels, 1)
         
         logger.info(f"HDBSCAN found {len(clusters)} clusters")
         return clusters
         
-    def _cluster_connected_components(self, adj_matrix: np.ndarray) -> List[List[int]]:
+    def _cluster_connected_components(self, adj_matrix: csr_matrix) -> List[List[int]]:
         """Basic connected components (no optimization)"""
-        sparse_matrix = csr_matrix(adj_matrix)
-        n_components, labels = connected_components(sparse_matrix, directed=False)
+        n_components, labels = connected_components(adj_matrix, directed=False)
         
-        # Group by component
-        clusters = defaultdict(list)
-        for idx, label in enumerate(labels):
-            clusters[label].append(idx)
-            
-        # Filter by min size
-        clusters = [c for c in clusters.values() if len(c) >= self.min_cluster_size]
+        # Group by component, filtering by min size
+        clusters = self._group_by_label(labels, self.min_cluster_size)
         
         logger.info(f"Connected components found {len(clusters)} clusters")
         return clusters
@@ -410,66 +793,70 @@ class UmbrellaBuilder:
         Returns:
             1-2 word label (capitalized)
         """
-        # Extract individual words from all topics
-        word_counts = defaultdict(int)
-        word_topics = defaultdict(set)  # Track which topics contain each word
-        
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                     'of', 'with', 'from', 'by', 'is', 'are', 'was', 'were', 'be', 'been',
-                     'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                     'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that',
-                     'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-                     'my', 'your', 'his', 'her', 'its', 'our', 'their', 'me', 'him',
-                     'just', 'like', 'really', 'very', 'too', 'so', 'such', 'make',
-                     'get', 'got', 'going', 'go', 'thing', 'things', 'people', 'person',
-                     'video', 'videos', 'watching', 'watch', 'thank', 'thanks'}
-        
-        for topic in cluster_topics:
-            words = topic.lower().split()
-            for word in words:
-                # Clean word
-                word = word.strip('.,!?;:()[]{}"\'-#')
-                if len(word) > 3 and word not in stopwords and word.isalpha():
-                    word_counts[word] += 1
-                    word_topics[word].add(topic)
-        
-        if not word_counts:
+        # Encode meaningful words from each topic as ids (first-seen order)
+        vocab: Dict[str, int] = {}
+        topic_words = [
+            [
+                vocab.setdefault(word, len(vocab))
+                for word in (w.strip(LABEL_PUNCTUATION) for w in topic.lower().split())
+                if len(word) > 3 and word not in LABEL_STOPWORDS and word.isalpha()
+            ]
+            for topic in cluster_topics
+        ]
+        
+        def topics_with(word_id: int) -> Set[int]:
+            return {i for i, words in enumerate(topic_words) if word_id in words}
+        
+        if not vocab:
             # Fallback: use first topic cleaned up
             first_topic = cluster_topics[0].lower()
-            words = [w.strip('.,!?;:()[]{}"\'-#') for w in first_topic.split()]
+            words = [w.strip(LABEL_PUNCTUATION) for w in first_topic.split()]
             for w in words:
-                if len(w) > 3 and w not in stopwords:
+                if len(w) > 3 and w not in LABEL_STOPWORDS:
                     return w.capitalize()
             return first_topic.split()[0].capitalize()
         
+        offsets = np.zeros(len(topic_words) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(words) for words in topic_words])
+        tokens = np.fromiter(
+            (word_id for words in topic_words for word_id in words),
+            dtype=np.int32, count=int(offsets[-1])
+        )
+        word_counts, word_coverage = _count_label_words(tokens, offsets, len(vocab))
+        words = list(vocab)
+        
         # Score words by coverage (prioritize words that appear in many topics)
-        word_scores = {}
-        for word, count in word_counts.items():
-            coverage = len(word_topics[word]) / len(cluster_topics)  # 0-1
-            # Heavily weight coverage to get broader terms
-            word_scores[word] = (coverage * 3) + (count * 0.5)
+        # Heavily weight coverage to get broader terms
+        n_topics = len(cluster_topics)
+        word_scores = [
+            (word_coverage[word_id] / n_topics * 3) + (word_counts[word_id] * 0.5)
+            for word_id in range(len(words))
+        ]
         
-        # Get top words
-        sorted_words = sorted(word_scores.items(), key=lambda x: x[1], reverse=True)
+        # Get top words (stable sort keeps first-seen order on ties)
+        sorted_ids = sorted(range(len(words)), key=word_scores.__getitem__, reverse=True)
         
         # Strategy: Use top word if it has good coverage (>30%)
-        top_word = sorted_words[0][0]
-        top_coverage = len(word_topics[top_word]) / len(cluster_topics)
+        top_id = sorted_ids[0]
+        top_word = words[top_id]
+        top_coverage = word_coverage[top_id] / n_topics
         
         # If single word has decent coverage, use it
-        if top_coverage >= 0.3 or len(sorted_words) == 1:
+        if top_coverage >= 0.3 or len(sorted_ids) == 1:
             return top_word.capitalize()
         
         # Otherwise, try to find a complementary second word
-        if len(sorted_words) >= 2:
-            for second_word, score in sorted_words[1:4]:  # Check next 3 words
+        if len(sorted_ids) >= 2:
+            top_topics = topics_with(top_id)
+            for second_id in sorted_ids[1:4]:  # Check next 3 words
                 # Check if they're complementary (not in same topics too often)
-                overlap = len(word_topics[top_word] & word_topics[second_word])
-                overlap_ratio = overlap / min(len(word_topics[top_word]), len(word_topics[second_word]))
+                second_topics = topics_with(second_id)
+                overlap = len(top_topics & second_topics)
+                overlap_ratio = overlap / min(len(top_topics), len(second_topics))
                 
                 # If they're complementary (<50% overlap), combine them
                 if overlap_ratio < 0.5:
-                    return f"{top_word.capitalize()} {second_word.capitalize()}"
+                    return f"{top_word.capitalize()} {words[second_id].capitalize()}"
         
         return top_word.capitalize()
         
@@ -494,41 +881,54 @@ class UmbrellaBuilder:
         """
         umbrellas = []
         
+        # Positions of the nodes for each canonical topic
+        canonical_nodes = defaultdict(list)
+        for position, node in enumerate(topic_nodes):
+            canonical_nodes[node.canonical].append(position)
+        
+        # Node stats as parallel arrays so cluster aggregates are vectorized
+        frequencies = np.asarray([node.frequency for node in topic_nodes])
+        avg_scores = np.asarray([node.avg_score for node in topic_nodes], dtype=np.float64)
+        
         for i, cluster_indices in enumerate(clusters):
             # Get canonical topics in this cluster
             cluster_topics = [canonical_topics[idx] for idx in cluster_indices]
             
-            # Find all nodes with these canonicals
-            cluster_nodes = [
-                node for node in topic_nodes 
-                if node.canonical in cluster_topics
-            ]
+            # Find all nodes with these canonicals (in topic_nodes order)
+            positions = np.sort(np.fromiter(
+                (p for topic in cluster_topics for p in canonical_nodes[topic]), dtype=np.intp
+            ))
             
-            if not cluster_nodes:
+            if not len(positions):
                 continue
                 
+            cluster_frequencies = frequencies[positions]
+            
             # Aggregate stats
-            total_frequency = sum(node.frequency for node in cluster_nodes)
-            video_ids = set()
-            for node in cluster_nodes:
-                video_ids.update(node.video_ids)
+            total_frequency = cluster_frequencies.sum().item()
+            video_ids = set().union(*(topic_nodes[position].video_ids for position in positions))
                 
             # Compute cluster coherence (average pairwise similarity)
             cluster_embeddings = embeddings[cluster_indices]
-            if len(cluster_embeddings) > 1:
-                sim_matrix = cosine_similarity(cluster_embeddings)
-                # Average of upper triangle (excluding diagonal)
-                mask = np.triu(np.ones_like(sim_matrix), k=1).astype(bool)
-                avg_coherence = sim_matrix[mask].mean()
+            k = len(cluster_embeddings)
+            if k == 2:
+                # Pairs are the most common cluster; one dot product suffices
+                avg_coherence = float(np.dot(cluster_embeddings[0], cluster_embeddings[1]))
+            elif k > 2:
+                # Mean of the off-diagonal dot products without the k x k matrix:
+                # |sum e|^2 is the sum of all pairwise dots, minus the diagonal
+                summed = cluster_embeddings.sum(axis=0, dtype=np.float64)
+                diagonal = np.einsum('ij,ij->', cluster_embeddings, cluster_embeddings, dtype=np.float64)
+                avg_coherence = float((summed @ summed - diagonal) / (k * (k - 1)))
             else:
                 avg_coherence = 1.0
                 
             # Generate broad umbrella label
             label = self._generate_umbrella_label(cluster_topics, cluster_embeddings)
             
-            # Get top representative topics (by frequency)
-            sorted_nodes = sorted(cluster_nodes, key=lambda n: n.frequency, reverse=True)
-            representative_topics = [n.canonical for n in sorted_nodes[:5]]
+            # Get top representative topics (by frequency, ties in node order)
+            top_positions = positions[np.argsort(-cluster_frequencies, kind='stable')[:5]]
+            representative_topics = [topic_nodes[position].canonical for position in top_positions]
             
             umbrella = UmbrellaCluster(
                 umbrella_id=f"umbrella_{i+1}",
@@ -540,9 +940,9 @@ class UmbrellaBuilder:
                 representative_topics=representative_topics,
                 video_ids=video_ids,
                 stats={
-                    'min_frequency': min(n.frequency for n in cluster_nodes),
-                    'max_frequency': max(n.frequency for n in cluster_nodes),
-                    'avg_score': np.mean([n.avg_score for n in cluster_nodes])
+                    'min_frequency': cluster_frequencies.min().item(),
+                    'max_frequency': cluster_frequencies.max().item(),
+                    'avg_score': avg_scores[positions].mean().item()
                 }
             )
             
@@ -557,6 +957,8 @@ class UmbrellaBuilder:
         """Return name of clustering method used"""
         if LEIDEN_AVAILABLE:
             return "leiden"
+        elif IGRAPH_AVAILABLE:
+            return "igraph_louvain"
         elif LOUVAIN_AVAILABLE:
             return "louvain"
         elif HDBSCAN_AVAILABLE:
@@ -598,12 +1000,18 @@ class UmbrellaBuilder:
                     
         logger.info(f"Found {len(accounts)} accounts with topics")
         
-        for username in accounts:
-            try:
-                self.build_account_umbrellas(username)
-            except Exception as e:
-                logger.error(f"Failed to build umbrellas for @{username}: {e}")
-                continue
+        embedding_map = self._encode_all_canonical_topics(accounts)
+        
+        # Accounts are independent; the shared model and embedding cache are
+        # thread-safe and the encoder releases the GIL during inference
+        with ThreadPoolExecutor(max_workers=UMBRELLA_WORKERS) as executor:
+            futures = [(username, executor.submit(self.build_account_umbrellas, username, embedding_map=embedding_map)) for username in accounts]
+            for username, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Failed to build umbrellas for @{username}: {e}")
+                    continue
 
 
 def main():
@@ -7,47 +7,207 @@ Checks folder structure and transcript counts for each account
 import os
 import sys
 import json
+import codecs
+import operator
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 
+# Optional faster JSON (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional streaming JSON parser for large results files (falls back to a full load)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def _read_json(path: Union[str, Path]) -> Any:
+    """Load a JSON file, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Indented UTF-8 JSON, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+
+# ijson events that start a value (map keys and end events do not)
+_IJSON_VALUE_EVENTS = frozenset({'start_map', 'start_array', 'string', 'number', 'boolean', 'null'})
+
+
+def _read_results_summary(path: str) -> Dict[str, Any]:
+    """
+    Summarize a results file: its stats, timestamp and processed video count
+    
+    With ijson the file is streamed, so processed_videos is counted without
+    building the list, and parsing stops once all three fields have been read.
+    """
+    if not IJSON_AVAILABLE:
+        results_data = _read_json(path)
+        return {
+            "stats": results_data.get("stats", {}),
+            "timestamp": results_data.get("timestamp"),
+            "processed_count": len(results_data.get("processed_videos", []))
+        }
+    
+    stats = {}
+    timestamp = None
+    processed_count = 0
+    stats_builder = None
+    pending = {'stats', 'timestamp', 'processed_videos'}
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if stats_builder is not None:
+                stats_builder.event(event, value)
+                if prefix == 'stats' and event in ('end_map', 'end_array'):
+                    stats = stats_builder.value
+                    stats_builder = None
+                    pending.discard('stats')
+            elif prefix == 'processed_videos.item':
+                if event in _IJSON_VALUE_EVENTS:
+                    processed_count += 1
+            elif prefix == 'processed_videos':
+                if event != 'start_array':
+                    pending.discard('processed_videos')
+            elif prefix == 'stats':
+                if event in ('start_map', 'start_array'):
+                    stats_builder = ijson.ObjectBuilder()
+                    stats_builder.event(event, value)
+                else:
+                    stats = value
+                    pending.discard('stats')
+            elif prefix == 'timestamp' and event in _IJSON_VALUE_EVENTS:
+                timestamp = value
+                pending.discard('timestamp')
+            
+            if not pending:
+                # Nothing else in the file is reported
+                break
+    
+    return {"stats": stats, "timestamp": timestamp, "processed_count": processed_count}
+
+
+# Filename suffix of transcript files (the prefix is the video id)
+TRANSCRIPT_SUFFIX = "_transcript.txt"
+
+# Separator between the transcript header and the transcription
+TRANSCRIPT_SEPARATOR = b"=" * 50
+
+# Bytes searched for the separator before reading further (the header is a
+# few fixed lines plus the video title, so this covers nearly every file)
+HEADER_READ_BYTES = 2048
+
+# Bytes per read when streaming the transcription
+READ_CHUNK_BYTES = 64 * 1024
+
+# Shape of a verify_account result (copied per account; lists are replaced)
+_RESULT_TEMPLATE = {
+    "account": "",
+    "path": "",
+    "exists": True,
+    "transcriptions_folder_exists": True,
+    "transcript_count": 0,
+    "results_file_exists": False,
+    "results_data": None,
+    "transcripts": None,
+    "issues": None
+}
+
+# Accounts verified concurrently (verification is I/O-bound)
+VERIFY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 class TranscriptVerifier:
     """Verify transcription outputs for TikTok accounts"""
     
-    def __init__(self, base_dir: str = "accounts"):
+    def __init__(self, base_dir: str = "accounts", cache_path: Optional[str] = None):
         """
         Initialize verifier
         
         Args:
             base_dir: Base directory containing account folders
+            cache_path: Transcript measurement cache (default: <base_dir>/.verify_cache.json)
         """
-        self.base_dir = Path(base_dir)
+        # Plain strings: per-account paths are only joined, listed and opened
+        self.base_dir = os.path.normpath(os.fspath(base_dir))
+        self.cache_path = Path(cache_path) if cache_path else Path(self.base_dir, ".verify_cache.json")
+        self._cache = self._load_cache()  # path -> {mtime_ns, size, char_count, line_count}
+        self._cache_lock = threading.Lock()
+        self._cache_dirty = False
+        
+    def _load_cache(self) -> Dict[str, Dict[str, int]]:
+        """Load cached transcript measurements, or {} if missing or unreadable"""
+        if not self.cache_path.exists():
+            return {}
+        try:
+            return _read_json(self.cache_path)
+        except (OSError, ValueError):
+            return {}
+            
+    def save_cache(self):
+        """Write transcript measurements to disk if any changed, replacing the file atomically"""
+        with self._cache_lock:
+            if not self._cache_dirty:
+                return
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._cache, f)
+                os.replace(tmp_path, self.cache_path)
+                self._cache_dirty = False
+            except OSError as e:
+                print(f"⚠️  Could not save verification cache {self.cache_path}: {e}", file=sys.stderr)
         
-    def verify_all_accounts(self) -> Dict[str, Any]:
+    def verify_all_accounts(self, prefix: Optional[str] = None) -> Dict[str, Any]:
         """
         Verify all accounts in the base directory
         
+        Args:
+            prefix: Only verify accounts whose name starts with this prefix
+            
         Returns:
             Dictionary with verification results
         """
-        if not self.base_dir.exists():
+        if not os.path.exists(self.base_dir):
             return {
                 "error": f"Base directory not found: {self.base_dir}",
                 "accounts": []
             }
         
-        accounts = []
+        # Find all account directories (names are filtered before any stat)
+        with os.scandir(self.base_dir) as it:
+            account_entries = [
+                entry for entry in it
+                if not entry.name.startswith('.')
+                and (not prefix or entry.name.startswith(prefix))
+                and entry.is_dir()
+            ]
         
-        # Find all account directories
-        for account_dir in self.base_dir.iterdir():
-            if account_dir.is_dir() and not account_dir.name.startswith('.'):
-                account_name = account_dir.name
-                result = self.verify_account(account_name)
-                accounts.append(result)
+        # Accounts are independent and verification is I/O-bound
+        with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as executor:
+            accounts = list(executor.map(
+                lambda entry: self.verify_account(entry.name, entry),
+                account_entries
+            ))
         
         # Sort by account name
         accounts.sort(key=lambda x: x['account'])
+        self.save_cache()
         
         return {
             "total_accounts": len(accounts),
@@ -55,82 +215,85 @@ class TranscriptVerifier:
             "verification_time": datetime.now().isoformat()
         }
     
-    def verify_account(self, account_name: str) -> Dict[str, Any]:
+    def verify_account(self, account_name: str, account_entry: Optional[os.DirEntry] = None) -> Dict[str, Any]:
         """
         Verify a single account's transcription outputs
         
         Args:
             account_name: TikTok account username
+            account_entry: Account directory entry from a base_dir scan, if available
             
         Returns:
             Verification result dictionary
         """
-        account_path = self.base_dir / account_name
-        transcriptions_path = account_path / "transcriptions"
+        account_path = os.path.join(self.base_dir, account_name)
+        transcriptions_path = os.path.join(account_path, "transcriptions")
+        results_name = f"{account_name}_results.json"
         
-        result = {
-            "account": account_name,
-            "path": str(account_path),
-            "exists": account_path.exists(),
-            "transcriptions_folder_exists": transcriptions_path.exists(),
-            "transcript_count": 0,
-            "results_file_exists": False,
-            "results_data": None,
-            "transcripts": [],
-            "issues": []
-        }
+        result = _RESULT_TEMPLATE.copy()
+        result["account"] = account_name
+        result["path"] = account_path
+        result["transcripts"] = []
+        result["issues"] = []
         
-        if not account_path.exists():
-            result["issues"].append("Account directory does not exist")
+        # One listing of the transcriptions folder answers every existence check
+        # (scandir entries carry a cached stat)
+        try:
+            with os.scandir(transcriptions_path) as it:
+                transcript_entries = []
+                for entry in it:
+                    if entry.name.endswith(TRANSCRIPT_SUFFIX):
+                        if entry.is_file():
+                            transcript_entries.append(entry)
+                    elif entry.name == results_name and entry.is_file():
+                        result["results_file_exists"] = True
+        except (FileNotFoundError, NotADirectoryError):
+            result["transcriptions_folder_exists"] = False
+            if account_entry is not None:
+                result["exists"] = account_entry.is_dir()
+            else:
+                result["exists"] = os.path.exists(account_path)
+            
+            if not result["exists"]:
+                result["issues"].append("Account directory does not exist")
+            else:
+                result["issues"].append("Transcriptions folder does not exist")
             return result
-        
-        if not transcriptions_path.exists():
-            result["issues"].append("Transcriptions folder does not exist")
+        except OSError as e:
+            # Unreadable folder (permissions, I/O error): report it on this
+            # account instead of aborting the whole run
+            result["issues"].append(f"Cannot read transcriptions folder: {e}")
             return result
-        
+
         # Check for results JSON file
-        results_file = transcriptions_path / f"{account_name}_results.json"
-        if results_file.exists():
-            result["results_file_exists"] = True
+        if result["results_file_exists"]:
+            results_file = os.path.join(transcriptions_path, results_name)
             try:
-                with open(results_file, 'r', encoding='utf-8') as f:
-                    results_data = json.load(f)
-                    result["results_data"] = {
-                        "stats": results_data.get("stats", {}),
-                        "timestamp": results_data.get("timestamp"),
-                        "processed_count": len(results_data.get("processed_videos", []))
-                    }
+                result["results_data"] = _read_results_summary(results_file)
             except Exception as e:
                 result["issues"].append(f"Failed to read results file: {e}")
         else:
             result["issues"].append("Results JSON file not found")
         
         # Count transcript files
-        transcript_files = list(transcriptions_path.glob("*_transcript.txt"))
-        result["transcript_count"] = len(transcript_files)
+        result["transcript_count"] = len(transcript_entries)
         
         # Verify each transcript
-        for transcript_file in sorted(transcript_files):
-            video_id = transcript_file.stem.replace("_transcript", "")
+        transcript_entries.sort(key=operator.attrgetter("name"))
+        for entry in transcript_entries:
+            video_id = entry.name[:-len(TRANSCRIPT_SUFFIX)]
             
             try:
-                # Read transcript file
-                with open(transcript_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Extract transcription (after the header separator)
-                if "=" * 50 in content:
-                    transcription = content.split("=" * 50, 1)[1].strip()
-                else:
-                    transcription = content
+                stat = entry.stat()
+                char_count, line_count = self._measure_transcript_cached(entry.path, stat)
                 
                 transcript_info = {
                     "video_id": video_id,
-                    "file": transcript_file.name,
-                    "file_size": transcript_file.stat().st_size,
-                    "char_count": len(transcription),
-                    "line_count": len(content.splitlines()),
-                    "has_content": len(transcription) > 50
+                    "file": entry.name,
+                    "file_size": stat.st_size,
+                    "char_count": char_count,
+                    "line_count": line_count,
+                    "has_content": char_count > 50
                 }
                 
                 result["transcripts"].append(transcript_info)
@@ -152,6 +315,92 @@ class TranscriptVerifier:
         
         return result
     
+    def _measure_transcript_cached(self, path: str, stat: os.stat_result) -> Tuple[int, int]:
+        """Measure a transcript, reusing the cached result while its mtime and size match"""
+        cached = self._cache.get(path)
+        if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+            return cached["char_count"], cached["line_count"]
+        
+        char_count, line_count = self._measure_transcript(path)
+        with self._cache_lock:
+            self._cache[path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "char_count": char_count,
+                "line_count": line_count
+            }
+            self._cache_dirty = True
+        return char_count, line_count
+    
+    def _measure_transcript(self, path: str) -> Tuple[int, int]:
+        """
+        Measure a transcript file without holding it in memory
+        
+        Args:
+            path: Transcript file path
+            
+        Returns:
+            (char_count, line_count): characters of the stripped transcription
+            after the header separator (the whole file if there is none), and
+            lines as counted by str.splitlines() for newline-delimited text
+        """
+        with open(path, 'rb') as f:
+            head = f.read(HEADER_READ_BYTES)
+            separator = head.find(TRANSCRIPT_SEPARATOR)
+            while separator == -1:
+                # Long titles can push the separator past the first read
+                more = f.read(READ_CHUNK_BYTES)
+                if not more:
+                    break
+                searched = max(0, len(head) - len(TRANSCRIPT_SEPARATOR) + 1)
+                head += more
+                separator = head.find(TRANSCRIPT_SEPARATOR, searched)
+            has_separator = separator != -1
+            if has_separator:
+                start = separator + len(TRANSCRIPT_SEPARATOR)
+                line_count = head.count(b"\n", 0, start)
+                # Header is not measured but must still be valid UTF-8
+                head[:start].decode('utf-8')
+                f.seek(start)
+            else:
+                line_count = 0
+                f.seek(0)
+            
+            # Strict, so undecodable transcripts are reported as failures
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            char_count = 0
+            pending_whitespace = 0  # trailing whitespace, dropped if nothing follows
+            started = not has_separator  # leading whitespace is stripped too
+            last_byte = head[start - 1:start] if has_separator else b""
+            
+            while True:
+                chunk = f.read(READ_CHUNK_BYTES)
+                final = not chunk
+                line_count += chunk.count(b"\n")
+                if chunk:
+                    last_byte = chunk[-1:]
+                
+                text = decoder.decode(chunk, final)
+                if not has_separator:
+                    char_count += len(text)
+                else:
+                    if not started:
+                        text = text.lstrip()
+                        started = bool(text)
+                    stripped = text.rstrip()
+                    if stripped:
+                        char_count += pending_whitespace + len(stripped)
+                        pending_whitespace = len(text) - len(stripped)
+                    else:
+                        pending_whitespace += len(text)
+                
+                if final:
+                    break
+        
+        if last_byte and last_byte != b"\n":
+            line_count += 1
+        return char_count, line_count
+    
     def print_report(self, verification: Dict[str, Any]):
         """
         Print a formatted verification report
@@ -159,63 +408,77 @@ class TranscriptVerifier:
         Args:
             verification: Verification results dictionary
         """
-        print("\n" + "=" * 80)
-        print("📊 TRANSCRIPT VERIFICATION REPORT")
-        print("=" * 80)
+        out = []
+        out.append("\n" + "=" * 80)
+        out.append("📊 TRANSCRIPT VERIFICATION REPORT")
+        out.append("=" * 80)
         
         if verification.get("error"):
-            print(f"\n❌ Error: {verification['error']}")
+            out.append(f"\n❌ Error: {verification['error']}")
+            sys.stdout.write("\n".join(out) + "\n")
             return
         
-        print(f"\nTotal accounts: {verification['total_accounts']}")
-        print(f"Verification time: {verification['verification_time']}")
-        print("\n" + "-" * 80)
+        out.append(f"\nTotal accounts: {verification['total_accounts']}")
+        out.append(f"Verification time: {verification['verification_time']}")
+        out.append("\n" + "-" * 80)
         
         for account in verification['accounts']:
-            print(f"\n📁 Account: @{account['account']}")
-            print(f"   Path: {account['path']}")
-            print(f"   Transcripts: {account['transcript_count']}")
+            out.append(f"\n📁 Account: @{account['account']}")
+            out.append(f"   Path: {account['path']}")
+            out.append(f"   Transcripts: {account['transcript_count']}")
             
-            if account['results_file_exists'] and account['results_data']:
-                stats = account['results_data'].get('stats', {})
-                print(f"   Processed: {stats.get('processed_videos', 0)}")
-                print(f"   Skipped: {stats.get('skipped_videos', 0)}")
-                print(f"   Failed: {stats.get('failed_videos', 0)}")
-                print(f"   Processing time: {stats.get('processing_time', 0):.2f}s")
-                print(f"   Last run: {account['results_data'].get('timestamp', 'Unknown')}")
+            results_data = account['results_data']
+            if account['results_file_exists'] and results_data:
+                stats = results_data.get('stats', {})
+                processed, skipped, failed, processing_time = (
+                    stats.get('processed_videos', 0),
+                    stats.get('skipped_videos', 0),
+                    stats.get('failed_videos', 0),
+                    stats.get('processing_time', 0),
+                )
+                out.append(
+                    f"   Processed: {processed}\n"
+                    f"   Skipped: {skipped}\n"
+                    f"   Failed: {failed}\n"
+                    f"   Processing time: {processing_time:.2f}s\n"
+                    f"   Last run: {results_data.get('timestamp', 'Unknown')}"
+                )
             
             # Show transcript details
             if account['transcripts']:
-                print(f"\n   Transcripts:")
+                out.append(f"\n   Transcripts:")
                 for t in account['transcripts']:
                     status = "✅" if t['has_content'] else "⚠️"
-                    print(f"      {status} {t['video_id']}: {t['char_count']} chars")
+                    out.append(f"      {status} {t['video_id']}: {t['char_count']} chars")
             
             # Show issues
             if account['issues']:
-                print(f"\n   ⚠️  Issues:")
+                out.append(f"\n   ⚠️  Issues:")
                 for issue in account['issues']:
-                    print(f"      - {issue}")
+                    out.append(f"      - {issue}")
             else:
-                print(f"\n   ✅ No issues found")
+                out.append(f"\n   ✅ No issues found")
             
-            print("-" * 80)
+            out.append("-" * 80)
         
         # Summary
         total_transcripts = sum(a['transcript_count'] for a in verification['accounts'])
         accounts_with_issues = sum(1 for a in verification['accounts'] if a['issues'])
         
-        print(f"\n📈 SUMMARY")
-        print(f"   Total accounts verified: {verification['total_accounts']}")
-        print(f"   Total transcripts: {total_transcripts}")
-        print(f"   Accounts with issues: {accounts_with_issues}")
+        out.append(f"\n📈 SUMMARY")
+        out.append(f"   Total accounts verified: {verification['total_accounts']}")
+        out.append(f"   Total transcripts: {total_transcripts}")
+        out.append(f"   Accounts with issues: {accounts_with_issues}")
         
         if accounts_with_issues == 0:
-            print(f"\n✅ All accounts verified successfully!")
+            out.append(f"\n✅ All accounts verified successfully!")
         else:
-            print(f"\n⚠️  {accounts_with_issues} account(s) have issues")
+            out.append(f"\n⚠️  {accounts_with_issues} account(s) have issues")
+        
+        out.append("\n" + "=" * 80 + "\n")
         
-        print("\n" + "=" * 80 + "\n")
+        # One write for the whole report instead of a print() per line
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -230,6 +493,7 @@ Examples:
   python verify_transcripts.py
   python verify_transcripts.py --base-dir accounts
   python verify_transcripts.py --account kwrt_
+  python verify_transcripts.py --prefix kw
         """
     )
     
@@ -237,6 +501,8 @@ Examples:
                        help='Base directory containing account folders (default: accounts)')
     parser.add_argument('--account', '-a', default=None,
                        help='Verify specific account only')
+    parser.add_argument('--prefix', default=None,
+                       help='Verify only accounts whose name starts with this prefix')
     parser.add_argument('--json', action='store_true',
                        help='Output results as JSON')
     
@@ -252,12 +518,13 @@ Examples:
             "accounts": [verifier.verify_account(account_name)],
             "verification_time": datetime.now().isoformat()
         }
+        verifier.save_cache()
     else:
-        result = verifier.verify_all_accounts()
+        result = verifier.verify_all_accounts(prefix=args.prefix.lstrip('@') if args.prefix else None)
     
     # Output results
     if args.json:
-        print(json.dumps(result, indent=2, default=str))
+        sys.stdout.buffer.write(_dumps_json(result) + b"\n")
     else:
         verifier.print_report(result)
     
@@ -3,21 +3,36 @@
 Worker main loop (Phase 0: stub)
 """
 
+import json
 import logging
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Union
 from worker import JobKind
 
 logger = logging.getLogger(__name__)
 
+# Optional faster JSON for queue payloads (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Hermes Phase 0 - Job handlers registry
-JOB_HANDLERS: Dict[JobKind, Callable] = {}  # Hermes Phase 0
+
+def _decode_job(payload: Union[bytes, str]) -> Dict[str, Any]:  # Hermes Phase 0
+    """Decode a job payload as dequeued from the job queue"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# Hermes Phase 0 - Job handlers registry, keyed by JobKind value (plain str hashing)
+JOB_HANDLERS: Dict[str, Callable] = {}  # Hermes Phase 0
 
 
 def register_handler(job_kind: JobKind):  # Hermes Phase 0
     """Decorator to register a job handler"""
     def decorator(func: Callable):
-        JOB_HANDLERS[job_kind] = func
+        JOB_HANDLERS[job_kind.value] = func
         return func
     return decorator
 
@@ -52,13 +67,13 @@ async def handle_generate_plan(job_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-async def process_job(job_kind: JobKind, job_data: Dict[str, Any]) -> Dict[str, Any]:  # Hermes Phase 0
+async def process_job(job_kind: JobKind, job_data: Union[Dict[str, Any], bytes, str]) -> Dict[str, Any]:  # Hermes Phase 0
     """
     Process a single job
     
     Args:
         job_kind: Type of job to process
-        job_data: Job payload
+        job_data: Job payload, decoded or as raw queue bytes/JSON text
     
     Returns:
         Job result
@@ -66,10 +81,12 @@ async def process_job(job_kind: JobKind, job_data: Dict[str, Any]) -> Dict[str,
     Raises:
         ValueError: If job_kind has no registered handler
     """
-    handler = JOB_HANDLERS.get(job_kind)  # Hermes Phase 0
+    handler = JOB_HANDLERS.get(job_kind.value if isinstance(job_kind, JobKind) else job_kind)  # Hermes Phase 0
     if not handler:
         raise ValueError(f"No handler registered for job kind: {job_kind}")
     
+    if isinstance(job_data, (bytes, str)):
+        job_data = _decode_job(job_data)
     return await handler(job_data)
 
 
@@ -80,7 +97,7 @@ async def worker_loop_tick():  # Hermes Phase 0
     In production, this would:
     1. Poll job queue for pending jobs
     2. Mark job as running
-    3. Process job with appropriate handler
+    3. Process job with appropriate handler (raw payloads via _decode_job)
     4. Mark job as done/failed
     5. Store result
     